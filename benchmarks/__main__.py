@@ -0,0 +1,79 @@
+"""
+Micro-benchmarks for the provider hot path.
+
+Run with ``python -m benchmarks``. Use ``--save`` to record the results as the
+new baseline, and ``--compare`` to fail if any benchmark is slower than the
+stored baseline by more than the regression threshold.
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+from typing import Dict
+
+from benchmarks.cases import BENCHMARKS
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def measure(operation, repeat: int) -> float:
+    """Returns the best observed time, in nanoseconds, of a single call to operation."""
+    timer = timeit.Timer(operation)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-k', '--filter', default='', help='only run benchmarks whose name contains this string')
+    parser.add_argument('--repeat', type=int, default=5, help='number of timing rounds per benchmark')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='path of the baseline file')
+    parser.add_argument('--save', action='store_true', help='store the results as the baseline')
+    parser.add_argument('--compare', action='store_true', help='fail if results regress against the baseline')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed slowdown relative to the baseline before failing (default: 0.25)')
+    args = parser.parse_args()
+
+    baseline: Dict[str, float] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results: Dict[str, float] = {}
+    regressions = []
+    for name, setup in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+
+        results[name] = measure(setup(), args.repeat)
+        line = '%-45s %12.1f ns/op' % (name, results[name])
+
+        expected = baseline.get(name)
+        if args.compare and expected is not None:
+            change = results[name] / expected - 1
+            line += '  %+7.1f%%' % (change * 100)
+            if change > args.threshold:
+                regressions.append(name)
+                line += '  REGRESSION'
+
+        print(line)
+
+    if args.save:
+        # Merge so that saving a filtered run keeps the baseline of the benchmarks which were not run.
+        baseline.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+    if regressions:
+        print('\n%d benchmark(s) regressed by more than %d%%: %s' % (
+            len(regressions), args.threshold * 100, ', '.join(regressions)), file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,237 @@
+import itertools
+from typing import Any, Callable, Dict
+
+from ldclient import Context
+from ldclient.evaluation import EvaluationDetail
+from ldclient.feature_store import InMemoryFeatureStore
+from ldclient.integrations.test_data import TestData
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.flag_evaluation import FlagType
+
+from ld_openfeature import Config, LaunchDarklyProvider, ReadThroughFeatureStore, from_ld_context
+from ld_openfeature.impl.context_cache import CachingEvaluationContextConverter
+from ld_openfeature.impl.context_converter import EvaluationContextConverter
+from ld_openfeature.impl.details_converter import ResolutionDetailsConverter
+from ld_openfeature.metrics import InMemoryMetricsSink
+
+# Each benchmark is registered as a setup function returning the operation to
+# time, so that setup cost is excluded from the measurement.
+BENCHMARKS: Dict[str, Callable[[], Callable[[], Any]]] = {}
+
+
+def benchmark(name: str):
+    def register(setup: Callable[[], Callable[[], Any]]):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def _single_context(attribute_count: int) -> EvaluationContext:
+    attributes: Dict[str, Any] = {'kind': 'user', 'name': 'Sandy', 'anonymous': False}
+    for index in range(attribute_count):
+        attributes['attribute-%d' % index] = 'value-%d' % index
+
+    return EvaluationContext('user-key', attributes)
+
+
+def _multi_context() -> EvaluationContext:
+    return EvaluationContext(None, {
+        'kind': 'multi',
+        'user': {'key': 'user-key', 'name': 'Sandy', 'plan': 'gold'},
+        'org': {'key': 'org-key', 'name': 'LaunchDarkly', 'region': 'us', 'privateAttributes': ['region']},
+        'device': {'key': 'device-key', 'os': 'linux'},
+    })
+
+
+def _provider(**kwargs) -> LaunchDarklyProvider:
+    td = TestData.data_source()
+    td.update(td.flag('boolean-flag').variation_for_all(True))
+    td.update(td.flag('string-flag').variations('a', 'b').variation_for_all(1))
+    td.update(td.flag('object-flag').variations({'a': 1}).variation_for_all(0))
+    for index in range(40):
+        td.update(td.flag('page-flag-%d' % index).variation_for_all(True))
+
+    return LaunchDarklyProvider(Config('bench-key', update_processor_class=td, send_events=False), **kwargs)
+
+
+def _register_context_conversions():
+    for attribute_count in (0, 10, 50):
+        def setup(attribute_count=attribute_count):
+            converter = EvaluationContextConverter()
+            context = _single_context(attribute_count)
+            return lambda: converter.to_ld_context(context)
+
+        benchmark('to_ld_context.single.%d_attributes' % attribute_count)(setup)
+
+    for validation in ('strict', 'trusted'):
+        def setup(validation=validation):
+            converter = EvaluationContextConverter(validation=validation)
+            context = _single_context(10)
+            return lambda: converter.to_ld_context(context)
+
+        benchmark('to_ld_context.single.10_attributes.%s' % validation)(setup)
+
+    for attribute_count in (10, 50):
+        def setup(attribute_count=attribute_count):
+            converter = CachingEvaluationContextConverter(EvaluationContextConverter(), 100)
+            context = _single_context(attribute_count)
+            return lambda: converter.to_ld_context(context)
+
+        benchmark('to_ld_context.single.%d_attributes.cache_hit' % attribute_count)(setup)
+
+
+_register_context_conversions()
+
+
+@benchmark('to_ld_context.multi.3_kinds')
+def _convert_multi_context():
+    converter = EvaluationContextConverter()
+    context = _multi_context()
+    return lambda: converter.to_ld_context(context)
+
+
+@benchmark('to_ld_context.multi.3_kinds.cache_hit')
+def _convert_multi_context_cache_hit():
+    converter = CachingEvaluationContextConverter(EvaluationContextConverter(), 100)
+    context = _multi_context()
+    return lambda: converter.to_ld_context(context)
+
+
+def _register_kind_reuse():
+    # A thousand users of a single org and device type, so each conversion is of a new whole context, while the
+    # org and device kinds are unchanged.
+    for kind_cache_size in (0, 100):
+        def setup(kind_cache_size=kind_cache_size):
+            converter = EvaluationContextConverter(kind_cache_size=kind_cache_size)
+            contexts = []
+            for index in range(1000):
+                context = _multi_context()
+                context.attributes['user'] = dict(context.attributes['user'], key='user-%d' % index)
+                contexts.append(context)
+            next_context = itertools.cycle(contexts).__next__
+            return lambda: converter.to_ld_context(next_context())
+
+        suffix = '.kind_cache' if kind_cache_size else ''
+        benchmark('to_ld_context.multi.3_kinds.new_user%s' % suffix)(setup)
+
+
+_register_kind_reuse()
+
+
+@benchmark('to_resolution_details.fallthrough')
+def _convert_fallthrough_details():
+    converter = ResolutionDetailsConverter()
+    detail = EvaluationDetail(True, 0, {'kind': 'FALLTHROUGH'})
+    return lambda: converter.to_resolution_details(detail)
+
+
+@benchmark('to_resolution_details.error')
+def _convert_error_details():
+    converter = ResolutionDetailsConverter()
+    detail = EvaluationDetail(True, None, {'kind': 'ERROR', 'errorKind': 'FLAG_NOT_FOUND'})
+    return lambda: converter.to_resolution_details(detail)
+
+
+@benchmark('resolve_boolean_details')
+def _resolve_boolean():
+    provider = _provider()
+    context = _single_context(10)
+    return lambda: provider.resolve_boolean_details('boolean-flag', False, context)
+
+
+@benchmark('resolve_boolean_details.context_cache')
+def _resolve_boolean_context_cache():
+    provider = _provider(context_cache_size=100)
+    context = _single_context(10)
+    return lambda: provider.resolve_boolean_details('boolean-flag', False, context)
+
+
+def _register_result_cache():
+    # The uncached 10 attribute case is resolve_boolean_details.
+    def setup_uncached():
+        provider = _provider()
+        context = _single_context(50)
+        return lambda: provider.resolve_boolean_details('boolean-flag', False, context)
+
+    benchmark('resolve_boolean_details.50_attributes')(setup_uncached)
+
+    for attribute_count in (10, 50):
+        def setup(attribute_count=attribute_count):
+            provider = _provider(result_cache_size=100)
+            context = _single_context(attribute_count)
+            return lambda: provider.resolve_boolean_details('boolean-flag', False, context)
+
+        benchmark('resolve_boolean_details.result_cache.%d_attributes' % attribute_count)(setup)
+
+
+_register_result_cache()
+
+
+@benchmark('resolve_boolean_details.metrics')
+def _resolve_boolean_with_metrics():
+    provider = _provider(metrics_sink=InMemoryMetricsSink())
+    context = _single_context(10)
+    return lambda: provider.resolve_boolean_details('boolean-flag', False, context)
+
+
+@benchmark('resolve_string_details')
+def _resolve_string():
+    provider = _provider()
+    context = _single_context(10)
+    return lambda: provider.resolve_string_details('string-flag', 'default', context)
+
+
+@benchmark('resolve_object_details')
+def _resolve_object():
+    provider = _provider()
+    context = _single_context(10)
+    return lambda: provider.resolve_object_details('object-flag', {}, context)
+
+
+@benchmark('resolve_boolean_details.multi_context')
+def _resolve_boolean_multi_context():
+    provider = _provider()
+    context = _multi_context()
+    return lambda: provider.resolve_boolean_details('boolean-flag', False, context)
+
+
+@benchmark('resolve_boolean_details.read_through_store')
+def _resolve_boolean_read_through_store():
+    td = TestData.data_source()
+    td.update(td.flag('boolean-flag').variation_for_all(True))
+    store = ReadThroughFeatureStore(InMemoryFeatureStore(), ttl=60)
+    provider = LaunchDarklyProvider(Config('bench-key', update_processor_class=td, feature_store=store,
+                                           send_events=False))
+    context = _single_context(10)
+    return lambda: provider.resolve_boolean_details('boolean-flag', False, context)
+
+
+@benchmark('resolve_many.40_flags')
+def _resolve_many():
+    provider = _provider()
+    context = _single_context(10)
+    specs = [('page-flag-%d' % index, FlagType.BOOLEAN, False) for index in range(40)]
+    return lambda: provider.resolve_many(specs, context)
+
+
+def _register_provider_overhead():
+    # The client is stubbed and the context is prebuilt, so only the provider's own work is measured.
+    cases = (
+        ('boolean', 'resolve_boolean_details', True, False),
+        ('string', 'resolve_string_details', 'b', 'default'),
+        ('integer', 'resolve_integer_details', 3, 0),
+    )
+    for name, method, value, default in cases:
+        def setup(method=method, value=value, default=default):
+            provider = _provider()
+            detail = EvaluationDetail(value, 1, {'kind': 'FALLTHROUGH'})
+            provider.client.variation_detail = lambda flag_key, context, default_value: detail
+            context = from_ld_context(Context.create('user-key'))
+            resolve = getattr(provider, method)
+            return lambda: resolve('flag-key', default, context)
+
+        benchmark('provider_overhead.%s' % name)(setup)
+
+
+_register_provider_overhead()
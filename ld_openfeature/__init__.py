@@ -1,7 +1,55 @@
-from ldclient.config import Config
-from ld_openfeature.provider import LaunchDarklyProvider
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from ldclient.config import Config
+    from ld_openfeature.context import LD_CONTEXT_ATTRIBUTE, from_ld_context
+    from ld_openfeature.impl.cache import CacheStats
+    from ld_openfeature.metrics import InMemoryMetricsSink, MetricsSink
+    from ld_openfeature.provider import LaunchDarklyProvider
+    from ld_openfeature.read_through_store import ReadThroughFeatureStore
+    from ld_openfeature.scope import EvaluationScope
+    from ld_openfeature.shared_client import SharedClient
+
+# The exports are loaded on first access, so that importing the package does not import the LaunchDarkly and
+# OpenFeature SDKs until they are needed.
+_EXPORTS = {
+    'CacheStats': 'ld_openfeature.impl.cache',
+    'Config': 'ldclient.config',
+    'EvaluationScope': 'ld_openfeature.scope',
+    'InMemoryMetricsSink': 'ld_openfeature.metrics',
+    'LD_CONTEXT_ATTRIBUTE': 'ld_openfeature.context',
+    'LaunchDarklyProvider': 'ld_openfeature.provider',
+    'MetricsSink': 'ld_openfeature.metrics',
+    'ReadThroughFeatureStore': 'ld_openfeature.read_through_store',
+    'SharedClient': 'ld_openfeature.shared_client',
+    'from_ld_context': 'ld_openfeature.context',
+}
 
 __all__ = [
+    'CacheStats',
     'Config',
-    'LaunchDarklyProvider'
+    'EvaluationScope',
+    'InMemoryMetricsSink',
+    'LD_CONTEXT_ATTRIBUTE',
+    'LaunchDarklyProvider',
+    'MetricsSink',
+    'ReadThroughFeatureStore',
+    'SharedClient',
+    'from_ld_context',
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    # __import__ rather than importlib.import_module, so that the import is reported by -X importtime.
+    value = getattr(__import__(module_name, fromlist=(name,)), name)
+    # Cache the export so later lookups do not go through this function.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
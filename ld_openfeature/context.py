@@ -0,0 +1,20 @@
+from typing import cast
+
+from ldclient.context import Context
+from openfeature.evaluation_context import EvaluationContext, EvaluationContextAttribute
+
+#: The evaluation context attribute which may carry an already built :class:`ldclient.Context`. When it is
+#: present, the provider evaluates against that context as-is and ignores every other attribute.
+LD_CONTEXT_ATTRIBUTE = 'ldContext'
+
+
+def from_ld_context(context: Context) -> EvaluationContext:
+    """
+    Wraps an already built :class:`ldclient.Context` in an EvaluationContext.
+
+    The provider recognizes the wrapped context and evaluates against it directly, without converting the
+    EvaluationContext. The wrapped context survives merging with other evaluation contexts, such as the
+    OpenFeature API and client contexts, but replaces their attributes entirely.
+    """
+    return EvaluationContext(context.key or None,
+                             {LD_CONTEXT_ATTRIBUTE: cast(EvaluationContextAttribute, context)})
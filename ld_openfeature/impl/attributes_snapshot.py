@@ -0,0 +1,56 @@
+from typing import Any, List, Mapping, Tuple
+
+
+class AttributesSnapshot:
+    """
+    A copy of a mapping of context attributes, used to confirm that a cache
+    entry was made for equal attributes.
+
+    Attributes are compared with dict equality, which does not look at the
+    types of values comparing equal across types (True and 1, for example),
+    although the converter treats them differently. The snapshot therefore
+    also records the type of every numeric or boolean value, and checks only
+    those.
+    """
+
+    __slots__ = ('__attributes', '__typed_values')
+
+    def __init__(self, attributes: Mapping[str, Any]):
+        # Copied, so that changes to the attributes do not change the snapshot.
+        typed_values: List[Tuple[Tuple[Any, ...], type]] = []
+        self.__attributes = _copy(attributes, (), typed_values)
+        self.__typed_values = tuple(typed_values)
+
+    def matches(self, attributes: Mapping[str, Any]) -> bool:
+        if attributes != self.__attributes:
+            return False
+
+        for path, cls in self.__typed_values:
+            value: Any = attributes
+            for step in path:
+                value = value[step]
+            if value.__class__ is not cls:
+                return False
+
+        return True
+
+
+def _copy(value: Any, path: Tuple[Any, ...], typed_values: List[Tuple[Tuple[Any, ...], type]]) -> Any:
+    # Copies the value, collecting the paths of its numeric and boolean values. The common concrete types are
+    # checked first, as isinstance checks against the abstract Mapping are comparatively slow, and strings, the
+    # most common values, are copied without a call.
+    cls = value.__class__
+    if cls is str or value is None:
+        return value
+    if cls is bool or cls is int or cls is float:
+        typed_values.append((path, cls))
+        return value
+    if cls is dict or (cls is not list and cls is not tuple and isinstance(value, Mapping)):
+        return {k: v if v.__class__ is str else _copy(v, path + (k,), typed_values) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        items = [v if v.__class__ is str else _copy(v, path + (index,), typed_values)
+                 for index, v in enumerate(value)]
+        return items if isinstance(value, list) else tuple(items)
+    if isinstance(value, (int, float)):
+        typed_values.append((path, cls))
+    return value
@@ -0,0 +1,119 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class CacheStats:
+    """
+    A point-in-time snapshot of the counters maintained by one of the
+    provider's internal caches.
+    """
+
+    def __init__(self, hits: int, misses: int, evictions: int, size: int, capacity: int):
+        self.__hits = hits
+        self.__misses = misses
+        self.__evictions = evictions
+        self.__size = size
+        self.__capacity = capacity
+
+    @property
+    def hits(self) -> int:
+        """The number of lookups which were satisfied by the cache."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """The number of lookups which were not satisfied by the cache."""
+        return self.__misses
+
+    @property
+    def evictions(self) -> int:
+        """The number of entries removed to make room for newer entries."""
+        return self.__evictions
+
+    @property
+    def size(self) -> int:
+        """The number of entries currently held by the cache."""
+        return self.__size
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of entries the cache will hold."""
+        return self.__capacity
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups which were satisfied by the cache, or 0 if there have been no lookups."""
+        lookups = self.__hits + self.__misses
+        return self.__hits / lookups if lookups else 0.0
+
+    def __repr__(self) -> str:
+        return "CacheStats(hits=%d, misses=%d, evictions=%d, size=%d, capacity=%d)" % (
+            self.__hits, self.__misses, self.__evictions, self.__size, self.__capacity)
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A thread-safe, bounded, least-recently-used cache which keeps hit, miss
+    and eviction counters.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+
+        self.__capacity = capacity
+        self.__entries: OrderedDict[K, V] = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def get(self, key: K, is_valid: Optional[Callable[[V], bool]] = None) -> Optional[V]:
+        """
+        Retrieve a cached value. If is_valid is provided and rejects the
+        cached value, the entry is removed and the lookup counts as a miss.
+        """
+        with self.__lock:
+            value = self.__entries.get(key)
+            if value is not None and is_valid is not None and not is_valid(value):
+                del self.__entries[key]
+                value = None
+
+            if value is None:
+                self.__misses += 1
+                return None
+
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return value
+
+    def peek(self, key: K) -> Optional[V]:
+        """Retrieve a cached value without counting the lookup or updating its recency."""
+        with self.__lock:
+            return self.__entries.get(key)
+
+    def put(self, key: K, value: V):
+        with self.__lock:
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+
+            if len(self.__entries) > self.__capacity:
+                self.__entries.popitem(last=False)
+                self.__evictions += 1
+
+    def discard(self, key: K):
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        with self.__lock:
+            return CacheStats(self.__hits, self.__misses, self.__evictions, len(self.__entries), self.__capacity)
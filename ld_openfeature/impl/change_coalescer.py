@@ -0,0 +1,58 @@
+import threading
+from typing import Callable, Dict, List, Optional
+
+
+class FlagChangeCoalescer:
+    """
+    Buffers changed flag keys and reports them in batches.
+
+    A batch is reported max_delay seconds after its first key was added, or as soon as it holds
+    max_batch_size distinct keys, whichever comes first. Keys are reported in the order they first changed,
+    and a key which changes several times within a batch is reported once.
+    """
+
+    def __init__(self, emit: Callable[[List[str]], None], max_delay: float, max_batch_size: Optional[int] = None):
+        if max_delay <= 0:
+            raise ValueError("max_delay must be a positive number of seconds")
+        if max_batch_size is not None and max_batch_size <= 0:
+            raise ValueError("max_batch_size must be a positive integer")
+
+        self.__emit = emit
+        self.__max_delay = max_delay
+        self.__max_batch_size = max_batch_size
+        self.__lock = threading.Lock()
+        self.__pending: Dict[str, None] = {}
+        self.__timer: Optional[threading.Timer] = None
+
+    def add(self, flag_key: str):
+        with self.__lock:
+            self.__pending[flag_key] = None
+
+            if self.__max_batch_size is not None and len(self.__pending) >= self.__max_batch_size:
+                batch = self.__take_batch()
+            else:
+                batch = None
+                if self.__timer is None:
+                    self.__timer = threading.Timer(self.__max_delay, self.flush)
+                    self.__timer.daemon = True
+                    self.__timer.start()
+
+        if batch:
+            self.__emit(batch)
+
+    def flush(self):
+        """Reports any buffered keys immediately."""
+        with self.__lock:
+            batch = self.__take_batch()
+
+        if batch:
+            self.__emit(batch)
+
+    def __take_batch(self) -> List[str]:
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+
+        batch = list(self.__pending)
+        self.__pending.clear()
+        return batch
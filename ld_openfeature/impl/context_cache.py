@@ -0,0 +1,102 @@
+from typing import Any, Hashable, Mapping, Optional, Tuple
+
+from ldclient.context import Context
+from openfeature.evaluation_context import EvaluationContext
+
+from ld_openfeature.impl.attributes_snapshot import AttributesSnapshot
+from ld_openfeature.impl.cache import CacheStats, LRUCache
+from ld_openfeature.impl.context_converter import EvaluationContextConverter
+
+
+def lookup_key(context: EvaluationContext) -> Optional[Hashable]:
+    """
+    Compute a cheap cache key for an EvaluationContext from the keys it
+    carries, without looking at its other attributes.
+
+    Different contexts may share a lookup key, so an entry found by it must be
+    confirmed with :meth:`ContextSnapshot.matches`. None is returned if the
+    keys cannot be hashed.
+    """
+    targeting_key = context.targeting_key
+    if targeting_key is not None:
+        return targeting_key
+
+    attributes = context.attributes
+    key = attributes.get('key')
+    if key.__class__ is str:
+        return key
+
+    # Multi-contexts carry a key in each of their kinds.
+    try:
+        keys = tuple(value.get('key') for value in attributes.values() if isinstance(value, dict))
+        hash(keys)
+        return keys
+    except TypeError:
+        return None
+
+
+def freeze(value: Any) -> Hashable:
+    cls = value.__class__
+    if cls is dict:
+        return (dict, tuple((k, freeze(v)) for k, v in value.items()))
+    if cls is list or cls is tuple:
+        return (list, tuple(freeze(v) for v in value))
+    if cls in _SCALAR_TYPES:
+        return (cls, value)
+    if isinstance(value, Mapping):
+        return (dict, tuple((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(freeze(v) for v in value))
+    return (cls, value)
+
+
+_SCALAR_TYPES = frozenset((str, bool, int, float, type(None)))
+
+
+class ContextSnapshot:
+    """
+    A copy of the targeting key and attributes of an EvaluationContext, used
+    to confirm that a cache entry was made for an equal context.
+    """
+
+    __slots__ = ('__targeting_key', '__attributes')
+
+    def __init__(self, context: EvaluationContext):
+        self.__targeting_key = context.targeting_key
+        self.__attributes = AttributesSnapshot(context.attributes)
+
+    def matches(self, context: EvaluationContext) -> bool:
+        return context.targeting_key == self.__targeting_key and self.__attributes.matches(context.attributes)
+
+
+class CachingEvaluationContextConverter:
+    """
+    Wraps a context converter, memoizing converted contexts in a
+    bounded LRU cache keyed by the keys carried by the EvaluationContext.
+
+    A context is not cached if it is invalid or its conversion logged a
+    problem, so that the problem is logged and counted every time it recurs.
+    """
+
+    def __init__(self, converter: EvaluationContextConverter, capacity: int):
+        self.__converter = converter
+        self.__cache: LRUCache[Hashable, Tuple[ContextSnapshot, Context]] = LRUCache(capacity)
+
+    def to_ld_context(self, context: EvaluationContext) -> Context:
+        key = lookup_key(context)
+        if key is None:
+            return self.__converter.to_ld_context(context)
+
+        entry = self.__cache.get(key, lambda cached: cached[0].matches(context))
+        if entry is not None:
+            return entry[1]
+
+        log_total = self.__converter.log_total
+        ld_context = self.__converter.to_ld_context(context)
+        if ld_context.valid and self.__converter.log_total == log_total:
+            self.__cache.put(key, (ContextSnapshot(context), ld_context))
+        return ld_context
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.__cache.stats
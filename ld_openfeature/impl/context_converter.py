@@ -1,14 +1,77 @@
 from logging import getLogger
-from typing import Any, Dict, List, Mapping, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Protocol, Set, Tuple
 
-from ldclient.context import Context, ContextBuilder, ContextMultiBuilder
+from ldclient.context import Context, ContextMultiBuilder
 from openfeature.evaluation_context import EvaluationContext, EvaluationContextAttribute
 
+from ld_openfeature.impl.attributes_snapshot import AttributesSnapshot
+from ld_openfeature.impl.cache import CacheStats, LRUCache
+from ld_openfeature.impl.rate_limited_log import RateLimitedLogger
+
 
 logger = getLogger("launchdarkly-openfeature-server")
 
 
+class ContextConverter(Protocol):
+    def to_ld_context(self, context: EvaluationContext) -> Context: ...
+
+
+#: Validate the built-in attributes of every context as it is converted, discarding invalid values.
+VALIDATION_PERMISSIVE = 'permissive'
+
+#: Reject a context whose built-in attributes are invalid, as checked while it is converted.
+VALIDATION_STRICT = 'strict'
+
+#: Do not validate the built-in attributes; the caller guarantees they are well formed.
+VALIDATION_TRUSTED = 'trusted'
+
+VALIDATION_MODES = (VALIDATION_PERMISSIVE, VALIDATION_STRICT, VALIDATION_TRUSTED)
+
+
 class EvaluationContextConverter:
+    def __init__(self, log_interval: float = 0, validation: str = VALIDATION_PERMISSIVE, kind_cache_size: int = 0):
+        """
+        :param log_interval: The minimum number of seconds between repeats of the same log message about an
+            invalid context. Defaults to 0, which logs every occurrence.
+        :param validation: One of the :data:`VALIDATION_MODES`, controlling how the types of the name,
+            anonymous and privateAttributes attributes are checked. Defaults to permissive.
+        :param kind_cache_size: The maximum number of converted kinds of multi-kind contexts to retain, so that a
+            kind whose attributes are unchanged, such as an org shared by many users, is reused rather than
+            converted again. Defaults to 0, which disables the cache.
+        """
+        if validation not in VALIDATION_MODES:
+            raise ValueError("validation must be one of %s" % ', '.join(VALIDATION_MODES))
+
+        self.__log = RateLimitedLogger(logger, log_interval)
+        self.__strict = validation == VALIDATION_STRICT
+        self.__handlers = _TRUSTED_ATTRIBUTES if validation == VALIDATION_TRUSTED else _RESERVED_ATTRIBUTES
+        self.__kind_cache: Optional[LRUCache[Tuple[str, str], Tuple[AttributesSnapshot, Context]]] = \
+            LRUCache(kind_cache_size) if kind_cache_size > 0 else None
+        self.__kind_cache_size = kind_cache_size
+        # The kinds seen once since the set was last cleared. Only kinds seen again are cached, so that kinds which
+        # are new on every evaluation, typically users, do not pay for a snapshot which is never used.
+        self.__kinds_seen: Set[Tuple[str, str]] = set()
+
+    @property
+    def log_counts(self) -> Dict[str, int]:
+        """The number of times each message about an invalid context has been logged or suppressed."""
+        return self.__log.counts
+
+    @property
+    def log_total(self) -> int:
+        """The number of messages about invalid contexts which have been logged or suppressed."""
+        return self.__log.total
+
+    @property
+    def kind_cache_stats(self) -> Optional[CacheStats]:
+        """The hit, miss and eviction counters of the cache of converted kinds, or None if it is disabled."""
+        return None if self.__kind_cache is None else self.__kind_cache.stats
+
+    def close(self):
+        """Report the repeats of log messages which are still suppressed."""
+        self.__log.close()
+
     def to_ld_context(self, context: EvaluationContext) -> Context:
         """
         Create an Context from an EvaluationContext.
@@ -24,7 +87,7 @@ class EvaluationContextConverter:
             return self.__build_multi_context(context)
 
         if kind is not None and not isinstance(kind, str):
-            logger.warning("'kind' was set to a non-string value; defaulting to user")
+            self.__log.warning("'kind' was set to a non-string value; defaulting to user")
             kind = 'user'
 
         targeting_key = context.targeting_key
@@ -41,16 +104,16 @@ class EvaluationContextConverter:
         if targeting_key is not None and targeting_key != "" and isinstance(key, str):
             # There is both a targeting key and a key. It will work, but
             # probably is not intentional.
-            logger.warning("EvaluationContext contained both a 'key' and 'targetingKey'.")
+            self.__log.warning("EvaluationContext contained both a 'key' and 'targetingKey'.")
 
         if key is not None and not isinstance(key, str):
-            logger.warning("A non-string 'key' attribute was provided.")
+            self.__log.warning("A non-string 'key' attribute was provided.")
 
         if key is not None and isinstance(key, str):
             targeting_key = targeting_key if targeting_key else key
 
         if targeting_key is None or targeting_key == "" or not isinstance(targeting_key, str):
-            logger.error("The EvaluationContext must contain either a 'targetingKey' or a 'key' and the type must be a string.")
+            self.__log.error("The EvaluationContext must contain either a 'targetingKey' or a 'key' and the type must be a string.")
 
         return targeting_key if targeting_key else ""
 
@@ -61,53 +124,163 @@ class EvaluationContextConverter:
             if kind == 'kind':
                 continue
 
-            if not isinstance(attributes, Dict):
-                logger.warning("Top level attributes in a multi-kind context should be dictionaries")
+            # Checked against dict rather than typing.Dict, whose isinstance checks are comparatively slow.
+            if not isinstance(attributes, dict):
+                self.__log.warning("Top level attributes in a multi-kind context should be dictionaries")
                 continue
 
-            key = attributes.get('key')
-            targeting_key = attributes.get('targetingKey')
+            ld_context = self.__convert_kind(kind, attributes)
+            if ld_context is not None:
+                builder.add(ld_context)
 
-            if targeting_key is not None and not isinstance(targeting_key, str):
-                continue
+        return builder.build()
 
-            targeting_key = self.__get_targeting_key(targeting_key, key)
-            single_context = self.__build_single_context(attributes, kind, targeting_key)
+    def __convert_kind(self, kind: str, attributes: Dict[str, Any]) -> Optional[Context]:
+        cache = self.__kind_cache
+        key = attributes.get('key')
+        if cache is None or not isinstance(key, str):
+            return self.__build_kind(kind, attributes)
 
-            builder.add(single_context)
+        # Kinds sharing a key, but differing in their other attributes, are told apart by the snapshot.
+        cache_key = (kind, key)
+        kinds_seen = self.__kinds_seen
+        if cache_key not in kinds_seen:
+            if len(kinds_seen) >= self.__kind_cache_size:
+                kinds_seen.clear()
+            kinds_seen.add(cache_key)
+            return self.__build_kind(kind, attributes)
 
-        return builder.build()
+        entry = cache.get(cache_key, lambda cached: cached[0].matches(attributes))
+        if entry is not None:
+            return entry[1]
+
+        # A kind which logged a problem is not cached, so that the problem is logged every time it recurs.
+        total = self.__log.total
+        ld_context = self.__build_kind(kind, attributes)
+        if ld_context is not None and ld_context.valid and self.__log.total == total:
+            cache.put(cache_key, (AttributesSnapshot(attributes), ld_context))
+        return ld_context
+
+    def __build_kind(self, kind: str, attributes: Dict[str, Any]) -> Optional[Context]:
+        key = attributes.get('key')
+        targeting_key = attributes.get('targetingKey')
+
+        if targeting_key is not None and not isinstance(targeting_key, str):
+            self.__log.error("A non-string 'targetingKey' attribute was provided for the '%s' kind." % kind)
+            if self.__strict:
+                return Context(kind, '', error="context has an invalid targetingKey")
+            return None
+
+        targeting_key = self.__get_targeting_key(targeting_key, key)
+        return self.__build_single_context(attributes, kind, targeting_key)
 
     def __build_single_context(self, attributes: Mapping[str, EvaluationContextAttribute], kind: str, key: str) -> Context:
-        builder = ContextBuilder(key)
-        builder.kind(kind)
+        handlers = self.__handlers
+        fields = _SingleContextFields()
+        custom_attributes: Dict[str, Any] = {}
+        valid = True
 
         for k, v in attributes.items():
-            if k == 'key' or k == 'targetingKey' or k == 'kind':
-                continue
+            handler = handlers.get(k)
+            if handler is not None:
+                error = handler(fields, v)
+                if error is not None:
+                    self.__log.error(error)
+                    valid = False
+            elif v is not None and k != '' and k != '_meta':
+                # Mirrors ContextBuilder.set, which ignores these names and treats None as unset.
+                custom_attributes[k] = v
 
-            if k == 'name' and isinstance(v, str):
-                builder.name(v)
-            elif k == 'name':
-                logger.error("The attribute 'name' must be a string")
-            elif k == 'anonymous' and isinstance(v, bool):
-                builder.anonymous(v)
-            elif k == 'anonymous':
-                logger.error("The attribute 'anonymous' must be a boolean")
-            elif k == 'privateAttributes' and isinstance(v, list):
-                private_attributes: List[str] = []
-                for private_attribute in v:
-                    if not isinstance(private_attribute, str):
-                        logger.error("'privateAttributes' must be an array of only string values")
-                        continue
-
-                    private_attributes.append(private_attribute)
-
-                if private_attributes:
-                    builder.private(*private_attributes)
-            elif k == 'privateAttributes':
-                logger.error("The attribute 'privateAttributes' must be an array")
-            else:
-                builder.set(k, v)
+        if self.__strict and not valid:
+            # Each problem has been reported, and the context is rejected as a whole.
+            return Context(kind, key, error="context has invalid built-in attributes")
 
-        return builder.build()
+        # Equivalent to ContextBuilder.build, without copying the attributes into the builder one at a time. This
+        # relies on the Context constructor's signature, which is not part of the SDK's public API, so the SDK
+        # version is bounded in pyproject.toml and the signature is checked by the tests.
+        return Context(kind, key, fields.name, fields.anonymous, custom_attributes or None,
+                       fields.private_attributes or None)
+
+
+class _SingleContextFields:
+    """The built-in attributes of a single-kind context, collected while scanning its attributes."""
+    __slots__ = ('name', 'anonymous', 'private_attributes')
+
+    def __init__(self) -> None:
+        self.name: Optional[str] = None
+        self.anonymous = False
+        self.private_attributes: List[str] = []
+
+
+def _ignore(fields: _SingleContextFields, value: Any) -> Optional[str]:
+    return None
+
+
+def _set_name(fields: _SingleContextFields, value: Any) -> Optional[str]:
+    if not isinstance(value, str):
+        return "The attribute 'name' must be a string"
+
+    fields.name = value
+    return None
+
+
+def _set_anonymous(fields: _SingleContextFields, value: Any) -> Optional[str]:
+    if not isinstance(value, bool):
+        return "The attribute 'anonymous' must be a boolean"
+
+    fields.anonymous = value
+    return None
+
+
+def _set_private_attributes(fields: _SingleContextFields, value: Any) -> Optional[str]:
+    if not isinstance(value, list):
+        return "The attribute 'privateAttributes' must be an array"
+
+    error = None
+    for private_attribute in value:
+        if not isinstance(private_attribute, str):
+            error = "'privateAttributes' must be an array of only string values"
+            continue
+
+        fields.private_attributes.append(private_attribute)
+
+    return error
+
+
+# Attributes with a special meaning, which are not copied into the context as custom attributes. Each handler
+# returns an error message if the value is invalid. The key and kind have already been resolved by the time
+# the attributes are scanned.
+_RESERVED_ATTRIBUTES: Mapping[str, Callable[[_SingleContextFields, Any], Optional[str]]] = MappingProxyType({
+    'key': _ignore,
+    'targetingKey': _ignore,
+    'kind': _ignore,
+    'name': _set_name,
+    'anonymous': _set_anonymous,
+    'privateAttributes': _set_private_attributes,
+})
+
+
+def _set_trusted_name(fields: _SingleContextFields, value: Any) -> Optional[str]:
+    fields.name = value
+    return None
+
+
+def _set_trusted_anonymous(fields: _SingleContextFields, value: Any) -> Optional[str]:
+    fields.anonymous = value
+    return None
+
+
+def _set_trusted_private_attributes(fields: _SingleContextFields, value: Any) -> Optional[str]:
+    fields.private_attributes.extend(value)
+    return None
+
+
+# The same attributes as _RESERVED_ATTRIBUTES, for values which are known to be valid.
+_TRUSTED_ATTRIBUTES: Mapping[str, Callable[[_SingleContextFields, Any], Optional[str]]] = MappingProxyType({
+    'key': _ignore,
+    'targetingKey': _ignore,
+    'kind': _ignore,
+    'name': _set_trusted_name,
+    'anonymous': _set_trusted_anonymous,
+    'privateAttributes': _set_trusted_private_attributes,
+})
@@ -1,68 +1,92 @@
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
 
 from ldclient.evaluation import EvaluationDetail
 from openfeature.exception import ErrorCode
 from openfeature.flag_evaluation import FlagResolutionDetails, Reason
 
+from ld_openfeature.impl.flag_metadata import EMPTY_METADATA, FlagMetadata
+
+# NOTE: FALLTHROUGH, RULE_MATCH, PREREQUISITE_FAILED intentionally omitted;
+# unmapped kinds are passed through unchanged.
+_REASONS: Mapping[str, str] = MappingProxyType({
+    'OFF': Reason.DISABLED,
+    'TARGET_MATCH': Reason.TARGETING_MATCH,
+    'ERROR': Reason.ERROR,
+})
+
+# NOTE: EXCEPTION_ERROR intentionally omitted; unmapped kinds become GENERAL.
+_ERROR_CODES: Mapping[Optional[str], ErrorCode] = MappingProxyType({
+    'CLIENT_NOT_READY': ErrorCode.PROVIDER_NOT_READY,
+    'FLAG_NOT_FOUND': ErrorCode.FLAG_NOT_FOUND,
+    'MALFORMED_FLAG': ErrorCode.PARSE_ERROR,
+    'USER_NOT_SPECIFIED': ErrorCode.TARGETING_KEY_MISSING,
+})
+
+# Variation indexes are small in practice, so the variant strings for the
+# common ones are created once and shared.
+_VARIANTS: Tuple[str, ...] = tuple(str(index) for index in range(256))
+
+# Only values of these types are safe to share between results, as they are
+# both hashable and immutable.
+_SHAREABLE_TYPES = (bool, str, int, float)
+
+_MAX_SHARED_RESULTS = 1024
+
 
 class ResolutionDetailsConverter:
-    def to_resolution_details(self, result: EvaluationDetail) -> FlagResolutionDetails:
+    def __init__(self, reuse_results: bool = False):
+        """
+        :param reuse_results: When True, results for scalar flag values are shared between evaluations which
+            produce the same value, variant and reason, rather than allocating a new result each time. Callers
+            must then treat the returned results as immutable.
+        """
+        self.__shared_results: Optional[Dict[Hashable, FlagResolutionDetails]] = {} if reuse_results else None
+
+    def to_resolution_details(self, result: EvaluationDetail,
+                              flag_metadata: FlagMetadata = EMPTY_METADATA) -> FlagResolutionDetails:
         value = result.value
-        is_default = result.is_default_value()
         variation_index = result.variation_index
 
         reason = result.reason
         reason_kind = reason.get('kind')
         reason_kind = reason_kind if isinstance(reason_kind, str) else ''
 
-        openfeature_reason = self.__kind_to_reason(reason_kind)
+        error_kind: Optional[str] = None
+        if reason_kind == "ERROR":
+            error_kind = reason.get('errorKind')
+
+        shared_results = self.__shared_results
+        if shared_results is None or value.__class__ not in _SHAREABLE_TYPES:
+            return self.__build(value, variation_index, reason_kind, error_kind, flag_metadata)
 
+        key = (value.__class__, value, variation_index, reason_kind, error_kind, flag_metadata)
+        details = shared_results.get(key)
+        if details is None:
+            details = self.__build(value, variation_index, reason_kind, error_kind, flag_metadata)
+            if len(shared_results) >= _MAX_SHARED_RESULTS:
+                shared_results.clear()
+            shared_results[key] = details
+
+        return details
+
+    @staticmethod
+    def __build(value: Any, variation_index: Optional[int], reason_kind: str, error_kind: Optional[str],
+                flag_metadata: FlagMetadata) -> FlagResolutionDetails:
         openfeature_error_code: Optional[ErrorCode] = None
         if reason_kind == "ERROR":
-            openfeature_error_code = self.__error_kind_to_code(reason.get('errorKind'))
+            openfeature_error_code = _ERROR_CODES.get(error_kind, ErrorCode.GENERAL)
 
         openfeature_variant: Optional[str] = None
-        if not is_default:
-            openfeature_variant = str(variation_index)
+        if variation_index is not None:
+            openfeature_variant = _VARIANTS[variation_index] if 0 <= variation_index < len(_VARIANTS) \
+                else str(variation_index)
 
         return FlagResolutionDetails(
             value=value,
             error_code=openfeature_error_code,
             error_message=None,
-            reason=openfeature_reason,
-            variant=openfeature_variant
-            # flag_metadata = FlagMetadata = field(default_factory=dict)
+            reason=_REASONS.get(reason_kind, reason_kind),
+            variant=openfeature_variant,
+            flag_metadata=flag_metadata,
         )
-        pass
-
-    @staticmethod
-    def __kind_to_reason(kind: str) -> str:
-        if kind == 'OFF':
-            return Reason.DISABLED
-        elif kind == 'TARGET_MATCH':
-            return Reason.TARGETING_MATCH
-        elif kind == 'ERROR':
-            return Reason.ERROR
-
-        # NOTE: FALLTHROUGH, RULE_MATCH, PREREQUISITE_FAILED intentionally
-        # omitted
-
-        return kind
-
-    @staticmethod
-    def __error_kind_to_code(error_kind: Optional[str]) -> ErrorCode:
-        if error_kind is None:
-            return ErrorCode.GENERAL
-
-        if error_kind == 'CLIENT_NOT_READY':
-            return ErrorCode.PROVIDER_NOT_READY
-        elif error_kind == 'FLAG_NOT_FOUND':
-            return ErrorCode.FLAG_NOT_FOUND
-        elif error_kind == 'MALFORMED_FLAG':
-            return ErrorCode.PARSE_ERROR
-        elif error_kind == 'USER_NOT_SPECIFIED':
-            return ErrorCode.TARGETING_KEY_MISSING
-
-        # NOTE: EXCEPTION_ERROR intentionally omitted
-
-        return ErrorCode.GENERAL
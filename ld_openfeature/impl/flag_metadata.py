@@ -0,0 +1,143 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterator, Mapping, Optional, Tuple, Union
+
+from ldclient.versioned_data_kind import FEATURES
+
+MetadataValue = Union[bool, int, float, str]
+
+
+class FlagMetadata(Mapping[str, MetadataValue]):
+    """
+    An immutable, hashable mapping of flag metadata.
+
+    Instances are shared between evaluations, so they are hashed once on
+    creation to make them cheap to use as part of a cache key.
+    """
+
+    __slots__ = ('__values', '__hash')
+
+    def __init__(self, values: Dict[str, MetadataValue]):
+        self.__values = values
+        self.__hash = hash(tuple(sorted(values.items())))
+
+    def __getitem__(self, key: str) -> MetadataValue:
+        return self.__values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__values)
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def __hash__(self) -> int:
+        return self.__hash
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FlagMetadata):
+            return self.__hash == other.__hash and self.__values == other.__values
+        if isinstance(other, Mapping):
+            return self.__values == dict(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return 'FlagMetadata(%r)' % self.__values
+
+
+EMPTY_METADATA = FlagMetadata({})
+
+
+class FlagMetadataCache:
+    """
+    Builds the flag metadata reported with resolution details, caching it per
+    flag and evaluation reason.
+
+    Entries for a flag remain valid until :func:`invalidate` is called for it,
+    which the provider does whenever the flag changes. Each flag has a
+    generation which is advanced by :func:`invalidate`, so metadata built from
+    a flag read before a change is not cached, even if the change arrives
+    before the metadata is stored.
+
+    When ``check_versions`` is True the flag is read for every lookup, and
+    cached metadata is only returned for the flag's current version. This is
+    for feature stores written by another process, whose changes are not
+    reported to :func:`invalidate`.
+    """
+
+    def __init__(self, get_flag: Callable[[str], Optional[Any]], check_versions: bool = False):
+        self.__get_flag = get_flag
+        self.__check_versions = check_versions
+        self.__lock = threading.Lock()
+        self.__entries: Dict[str, Dict[Hashable, FlagMetadata]] = {}
+        self.__generations: Dict[str, int] = {}
+
+    def get(self, flag_key: str, reason: Mapping[str, Any]) -> FlagMetadata:
+        reason_key = (reason.get('kind'), reason.get('ruleIndex'), reason.get('ruleId'), reason.get('inExperiment'))
+        if self.__check_versions:
+            return self.__get_current(flag_key, reason_key)
+
+        flag_entries = self.__entries.get(flag_key)
+        if flag_entries is not None:
+            metadata = flag_entries.get(reason_key)
+            if metadata is not None:
+                return metadata
+
+        generation = self.__generations.get(flag_key, 0)
+        flag = self.__get_flag(flag_key)
+        if flag is None:
+            return EMPTY_METADATA
+
+        metadata = FlagMetadata(self.__build(FEATURES.encode(flag), reason_key))
+        with self.__lock:
+            if self.__generations.get(flag_key, 0) == generation:
+                self.__entries.setdefault(flag_key, {})[reason_key] = metadata
+
+        return metadata
+
+    def __get_current(self, flag_key: str, reason_key: Tuple[Any, ...]) -> FlagMetadata:
+        flag = self.__get_flag(flag_key)
+        if flag is None:
+            return EMPTY_METADATA
+
+        encoded_flag = FEATURES.encode(flag)
+        flag_entries = self.__entries.get(flag_key)
+        if flag_entries is not None:
+            metadata = flag_entries.get(reason_key)
+            if metadata is not None and metadata['version'] == encoded_flag.get('version', 0):
+                return metadata
+
+        metadata = FlagMetadata(self.__build(encoded_flag, reason_key))
+        with self.__lock:
+            # The stored version may be older than another thread's, which the version check then replaces.
+            self.__entries.setdefault(flag_key, {})[reason_key] = metadata
+
+        return metadata
+
+    def invalidate(self, flag_key: str):
+        with self.__lock:
+            self.__generations[flag_key] = self.__generations.get(flag_key, 0) + 1
+            self.__entries.pop(flag_key, None)
+
+    @staticmethod
+    def __build(flag: Mapping[str, Any], reason_key: Tuple[Any, ...]) -> Dict[str, MetadataValue]:
+        kind, rule_index, rule_id, in_experiment = reason_key
+
+        track_events = bool(flag.get('trackEvents', False))
+        if kind == 'FALLTHROUGH' and flag.get('trackEventsFallthrough', False):
+            track_events = True
+        elif kind == 'RULE_MATCH' and isinstance(rule_index, int):
+            rules = flag.get('rules') or []
+            if 0 <= rule_index < len(rules) and rules[rule_index].get('trackEvents', False):
+                track_events = True
+
+        values: Dict[str, MetadataValue] = {
+            'version': flag.get('version', 0),
+            'trackEvents': track_events,
+        }
+        if isinstance(rule_index, int):
+            values['ruleIndex'] = rule_index
+        if isinstance(rule_id, str):
+            values['ruleId'] = rule_id
+        if in_experiment is not None:
+            values['inExperiment'] = bool(in_experiment)
+
+        return values
@@ -0,0 +1,26 @@
+from ldclient.context import Context
+from openfeature.evaluation_context import EvaluationContext
+
+from ld_openfeature.context import LD_CONTEXT_ATTRIBUTE
+from ld_openfeature.impl.context_converter import ContextConverter
+
+
+class PassthroughContextConverter:
+    """
+    Wraps a context converter, returning the :class:`ldclient.Context`
+    carried in the LD_CONTEXT_ATTRIBUTE attribute unchanged and delegating
+    every other EvaluationContext to the wrapped converter.
+
+    The carried context is not rebuilt or copied. If it is invalid, the SDK
+    reports the problem when it is evaluated.
+    """
+
+    def __init__(self, converter: ContextConverter):
+        self.__converter = converter
+
+    def to_ld_context(self, context: EvaluationContext) -> Context:
+        ld_context = context.attributes.get(LD_CONTEXT_ATTRIBUTE)
+        if isinstance(ld_context, Context):
+            return ld_context
+
+        return self.__converter.to_ld_context(context)
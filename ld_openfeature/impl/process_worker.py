@@ -0,0 +1,42 @@
+"""
+Functions executed in worker processes by
+:func:`ld_openfeature.LaunchDarklyProvider.resolve_for_contexts_in_processes`.
+
+Each worker holds a single provider backed by a flag snapshot file rather than
+a connection to LaunchDarkly.
+"""
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.flag_evaluation import FlagResolutionDetails, FlagType
+
+if TYPE_CHECKING:
+    from ld_openfeature.provider import LaunchDarklyProvider
+
+_provider: Optional['LaunchDarklyProvider'] = None
+
+
+def initialize_worker(sdk_key: str, snapshot_path: str, context_validation: str, context_log_interval: float):
+    global _provider
+
+    # Imported here to avoid a circular import with the provider module.
+    from ldclient import Config
+    from ldclient.integrations import Files
+    from ld_openfeature.provider import LaunchDarklyProvider
+
+    config = Config(sdk_key,
+                    update_processor_class=Files.new_data_source(paths=[snapshot_path]),
+                    send_events=False,
+                    diagnostic_opt_out=True)
+    # Contexts are converted the same way as by the parent's provider, so results match a thread pool's.
+    _provider = LaunchDarklyProvider(config, context_validation=context_validation,
+                                     context_log_interval=context_log_interval)
+    _provider.initialize(EvaluationContext())
+
+
+def resolve_chunk(flag_key: str, flag_type: FlagType, default_value: Any,
+                  evaluation_contexts: List[Optional[EvaluationContext]]) -> List[FlagResolutionDetails]:
+    if _provider is None:
+        raise RuntimeError("worker process was not initialized")
+
+    return list(_provider.resolve_for_contexts(flag_key, flag_type, default_value, evaluation_contexts))
@@ -0,0 +1,136 @@
+import logging
+import threading
+from time import monotonic
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class _MessageState:
+    __slots__ = ('level', 'count', 'suppressed', 'window_start')
+
+    def __init__(self, level: int, window_start: float):
+        self.level = level
+        self.count = 0
+        self.suppressed = 0
+        self.window_start = window_start
+
+
+class RateLimitedLogger:
+    """
+    Wraps a logger so that each distinct message is written at most once per
+    interval.
+
+    Repeats of a message within the interval are counted rather than logged.
+    Once the interval has elapsed, the message is logged again with the
+    number of repeats which were suppressed, either when it next recurs or
+    from a background timer if it does not, so summaries are written even
+    after the repeats stop. :func:`close` reports any repeats still pending.
+    The total number of times each message was logged or suppressed is
+    available from :attr:`counts`.
+    """
+
+    def __init__(self, logger: logging.Logger, interval: float, clock: Callable[[], float] = monotonic):
+        """
+        :param logger: The logger messages are written to.
+        :param interval: The minimum number of seconds between writes of the same message. A value of zero or
+            less writes every message, while still counting them.
+        :param clock: The source of the current time, in seconds.
+        """
+        self.__logger = logger
+        self.__interval = interval
+        self.__clock = clock
+        self.__lock = threading.Lock()
+        self.__messages: Dict[str, _MessageState] = {}
+        self.__total = 0
+        self.__timer: Optional[threading.Timer] = None
+        self.__closed = False
+
+    def warning(self, message: str):
+        self.__log(logging.WARNING, message)
+
+    def error(self, message: str):
+        self.__log(logging.ERROR, message)
+
+    def __log(self, level: int, message: str):
+        now = self.__clock()
+        with self.__lock:
+            self.__total += 1
+            state = self.__messages.get(message)
+            if state is None:
+                state = self.__messages[message] = _MessageState(level, now)
+            elif now - state.window_start < self.__interval:
+                state.count += 1
+                state.suppressed += 1
+                if state.suppressed == 1:
+                    self.__schedule_flush(state.window_start + self.__interval - now)
+                return
+
+            state.count += 1
+            suppressed = state.suppressed
+            state.suppressed = 0
+            state.window_start = now
+
+        self.__write(level, message, suppressed)
+
+    def close(self):
+        """Stop the background timer and report the repeats of every message which are still suppressed."""
+        with self.__lock:
+            self.__closed = True
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+            pending = self.__take_suppressed(self.__clock(), lambda state: True)
+
+        for level, message, suppressed in pending:
+            self.__write(level, message, suppressed)
+
+    def __schedule_flush(self, delay: float):
+        # Called with the lock held. A single timer serves every message; it reschedules itself while repeats
+        # remain suppressed.
+        if self.__timer is not None or self.__closed:
+            return
+
+        self.__timer = threading.Timer(max(delay, 0), self.__flush_expired)
+        self.__timer.daemon = True
+        self.__timer.start()
+
+    def __flush_expired(self):
+        now = self.__clock()
+        with self.__lock:
+            self.__timer = None
+            pending = self.__take_suppressed(now, lambda state: now - state.window_start >= self.__interval)
+
+            next_expiry = min((state.window_start + self.__interval for state in self.__messages.values()
+                               if state.suppressed), default=None)
+            if next_expiry is not None:
+                self.__schedule_flush(next_expiry - now)
+
+        for level, message, suppressed in pending:
+            self.__write(level, message, suppressed)
+
+    def __take_suppressed(self, now: float,
+                          is_due: Callable[[_MessageState], bool]) -> List[Tuple[int, str, int]]:
+        # Called with the lock held. Reporting a message's repeats starts a new interval for it, as logging it does.
+        pending = []
+        for message, state in self.__messages.items():
+            if state.suppressed and is_due(state):
+                pending.append((state.level, message, state.suppressed))
+                state.suppressed = 0
+                state.window_start = now
+        return pending
+
+    def __write(self, level: int, message: str, suppressed: int):
+        if suppressed:
+            self.__logger.log(level, "%s (suppressed %d repeats of this message)", message, suppressed)
+        else:
+            self.__logger.log(level, message)
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """The number of times each message has been logged, including suppressed repeats."""
+        with self.__lock:
+            return {message: state.count for message, state in self.__messages.items()}
+
+    @property
+    def total(self) -> int:
+        """The number of messages which have been logged, including suppressed repeats."""
+        return self.__total
@@ -0,0 +1,73 @@
+import threading
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.flag_evaluation import FlagResolutionDetails
+
+from ld_openfeature.impl.cache import CacheStats, LRUCache
+from ld_openfeature.impl.context_cache import ContextSnapshot, freeze, lookup_key
+
+_Entry = Tuple[int, ContextSnapshot, FlagResolutionDetails]
+
+
+def result_key(flag_key: str, value_type: Hashable, default_value: Any,
+               context: EvaluationContext) -> Optional[Hashable]:
+    """
+    Compute the cache key of an evaluation, or None if the context's keys or
+    the default value cannot be hashed. The value_type identifies the type the
+    flag value is resolved as.
+
+    The key only includes the keys carried by the context, so an entry found
+    by it is confirmed against the full context by :func:`EvaluationResultCache.get`.
+    """
+    context_key = lookup_key(context)
+    if context_key is None:
+        return None
+
+    key = (flag_key, value_type, freeze(default_value), context_key)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+class EvaluationResultCache:
+    """
+    A bounded LRU cache of resolution details for a flag and evaluation
+    context.
+
+    Entries are keyed by :func:`result_key` and remember a snapshot of the
+    context they were evaluated for, so a context which shares the keys of a
+    cached one but differs in its other attributes is evaluated again.
+
+    Each flag has a generation which is advanced by :func:`invalidate`.
+    Entries remember the generation of their flag at the time the evaluation
+    started, so an entry made stale by a flag change is never returned, even
+    if the change happened while the evaluation was in progress.
+    """
+
+    def __init__(self, capacity: int):
+        self.__cache: LRUCache[Hashable, _Entry] = LRUCache(capacity)
+        self.__lock = threading.Lock()
+        self.__generations: Dict[str, int] = {}
+
+    def generation(self, flag_key: str) -> int:
+        return self.__generations.get(flag_key, 0)
+
+    def get(self, flag_key: str, key: Hashable, context: EvaluationContext) -> Optional[FlagResolutionDetails]:
+        generation = self.generation(flag_key)
+        entry = self.__cache.get(key, lambda cached: cached[0] == generation and cached[1].matches(context))
+        return None if entry is None else entry[2]
+
+    def put(self, key: Hashable, generation: int, context: EvaluationContext, details: FlagResolutionDetails):
+        self.__cache.put(key, (generation, ContextSnapshot(context), details))
+
+    def invalidate(self, flag_key: str):
+        with self.__lock:
+            self.__generations[flag_key] = self.__generations.get(flag_key, 0) + 1
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.__cache.stats
@@ -0,0 +1,117 @@
+import json
+import os
+import tempfile
+import threading
+from logging import getLogger
+from typing import Any, Callable, Dict, Optional
+
+from ldclient.interfaces import FeatureStore
+from ldclient.versioned_data_kind import FEATURES, SEGMENTS, VersionedDataKind
+
+
+logger = getLogger("launchdarkly-openfeature-server")
+
+
+def write_snapshot(store: FeatureStore, path: str):
+    """
+    Write the flags and segments held by a feature store to a file.
+
+    The file uses the format read by :func:`ldclient.integrations.Files.new_data_source`, so it can back a
+    client which never connects to LaunchDarkly. The file is replaced atomically, so readers never observe a
+    partially written snapshot. It is only readable by its owner, as it contains every segment's targeted keys.
+    """
+    data = {
+        'flags': _encode_all(store, FEATURES),
+        'segments': _encode_all(store, SEGMENTS),
+    }
+
+    # Created beside the snapshot with an unpredictable name and owner-only permissions, then moved over it.
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=os.path.basename(path) + '.',
+                                     suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load_snapshot(store: FeatureStore, path: str) -> bool:
+    """
+    Initialize a feature store from a snapshot written by :func:`write_snapshot`.
+
+    Stores which are already initialized, such as a populated persistent store, are left untouched. Returns
+    True if the store was initialized from the snapshot.
+    """
+    if store.initialized:
+        return False
+
+    try:
+        with open(path, 'rb') as f:
+            data = json.loads(f.read())
+    except FileNotFoundError:
+        return False
+    except (OSError, ValueError) as e:
+        logger.warning("Unable to read flag snapshot %s: %s", path, e)
+        return False
+
+    if not isinstance(data, dict):
+        logger.warning("Ignoring flag snapshot %s as it is not a JSON object", path)
+        return False
+
+    store.init({
+        FEATURES: data.get('flags') or {},
+        SEGMENTS: data.get('segments') or {},
+    })
+    return True
+
+
+def _encode_all(store: FeatureStore, kind: VersionedDataKind) -> Dict[str, Any]:
+    items = store.all(kind, lambda items: items) or {}
+    return {key: kind.encode(item) for key, item in items.items()}
+
+
+class SnapshotWriter:
+    """
+    Periodically writes a snapshot of a feature store to a file on a background thread.
+
+    Snapshots are only written while should_write returns True, so that a snapshot is never replaced by an
+    empty store.
+    """
+
+    def __init__(self, store: FeatureStore, path: str, interval: float, should_write: Callable[[], bool]):
+        if interval <= 0:
+            raise ValueError("interval must be a positive number of seconds")
+
+        self.__store = store
+        self.__path = path
+        self.__interval = interval
+        self.__should_write = should_write
+        self.__stopped = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self.__thread = threading.Thread(target=self.__run, name="ld-openfeature-snapshot", daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        self.__stopped.set()
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def __run(self):
+        while not self.__stopped.wait(self.__interval):
+            self.write()
+
+    def write(self) -> bool:
+        """Writes a snapshot immediately if allowed. Returns True if a snapshot was written."""
+        if not self.__should_write():
+            return False
+
+        try:
+            write_snapshot(self.__store, self.__path)
+            return True
+        except Exception as e:
+            logger.warning("Unable to write flag snapshot %s: %s", self.__path, e)
+            return False
@@ -0,0 +1,24 @@
+from time import perf_counter
+
+from ldclient.context import Context
+from openfeature.evaluation_context import EvaluationContext
+
+from ld_openfeature.impl.context_converter import ContextConverter
+from ld_openfeature.metrics import MetricsSink
+
+
+class TimedEvaluationContextConverter:
+    """
+    Wraps a context converter, reporting the duration of each conversion to a
+    metrics sink.
+    """
+
+    def __init__(self, converter: ContextConverter, sink: MetricsSink):
+        self.__converter = converter
+        self.__sink = sink
+
+    def to_ld_context(self, context: EvaluationContext) -> Context:
+        start = perf_counter()
+        ld_context = self.__converter.to_ld_context(context)
+        self.__sink.record_context_conversion(perf_counter() - start)
+        return ld_context
@@ -0,0 +1,50 @@
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+from openfeature.flag_evaluation import FlagType
+
+# Converts a raw flag value into the expected type, returning None if the value
+# does not have that type.
+ValueCast = Callable[[Any], Any]
+
+
+def cast_boolean(value: Any) -> Any:
+    return value if isinstance(value, bool) else None
+
+
+def cast_string(value: Any) -> Any:
+    return value if isinstance(value, str) else None
+
+
+def cast_integer(value: Any) -> Any:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return int(value)  # Float decimals are truncated to int
+    return None
+
+
+def cast_float(value: Any) -> Any:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+def cast_object(value: Any) -> Any:
+    return value if isinstance(value, (dict, list)) else None
+
+
+def _mismatch(value: Any) -> Any:
+    return None
+
+
+_CASTS: Mapping[FlagType, ValueCast] = MappingProxyType({
+    FlagType.BOOLEAN: cast_boolean,
+    FlagType.STRING: cast_string,
+    FlagType.INTEGER: cast_integer,
+    FlagType.FLOAT: cast_float,
+    FlagType.OBJECT: cast_object,
+})
+
+
+def cast_for(flag_type: FlagType) -> ValueCast:
+    """Select the cast for a flag type. Values of an unknown flag type are always a mismatch."""
+    return _CASTS.get(flag_type, _mismatch)
@@ -0,0 +1,180 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from openfeature.exception import ErrorCode
+
+#: The phase covering conversion of an EvaluationContext into a LaunchDarkly context.
+PHASE_CONTEXT_CONVERSION = 'context_conversion'
+
+#: The phase covering the flag evaluation performed by the LaunchDarkly SDK.
+PHASE_SDK_EVALUATION = 'sdk_evaluation'
+
+#: The phase covering type validation and conversion of the result into resolution details.
+PHASE_DETAILS_CONVERSION = 'details_conversion'
+
+PHASES = (PHASE_CONTEXT_CONVERSION, PHASE_SDK_EVALUATION, PHASE_DETAILS_CONVERSION)
+
+#: The default upper bounds, in seconds, of the latency histogram buckets.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.1,
+)
+
+
+class MetricsSink:
+    """
+    Receives instrumentation from :class:`ld_openfeature.LaunchDarklyProvider`.
+
+    Implementations are called on the evaluating thread, so they should be cheap and must be thread-safe.
+    """
+
+    def record_context_conversion(self, duration: float):
+        """
+        Records the time, in seconds, taken to convert an evaluation context.
+
+        This is called once per conversion, which may be shared by several evaluations.
+        """
+        pass
+
+    def record_evaluation(self, flag_key: str, error_code: Optional[ErrorCode], evaluation_duration: float,
+                          details_duration: float):
+        """
+        Records a single flag evaluation.
+
+        :param flag_key: The key of the evaluated flag.
+        :param error_code: The error code of the result, or None if the evaluation succeeded.
+        :param evaluation_duration: The time, in seconds, spent evaluating the flag in the LaunchDarkly SDK.
+        :param details_duration: The time, in seconds, spent converting the result into resolution details.
+        """
+        pass
+
+
+class Histogram:
+    """A point-in-time snapshot of a latency histogram."""
+
+    def __init__(self, buckets: Tuple[float, ...], counts: List[int], total: float):
+        self.__buckets = buckets
+        self.__counts = counts
+        self.__total = total
+
+    @property
+    def buckets(self) -> Tuple[float, ...]:
+        """The upper bounds, in seconds, of each bucket. Observations above the last bound are counted separately."""
+        return self.__buckets
+
+    @property
+    def counts(self) -> List[int]:
+        """The (non-cumulative) number of observations in each bucket, followed by the overflow count."""
+        return self.__counts
+
+    @property
+    def count(self) -> int:
+        """The total number of observations."""
+        return sum(self.__counts)
+
+    @property
+    def sum(self) -> float:
+        """The sum, in seconds, of all observations."""
+        return self.__total
+
+
+class _HistogramState:
+    __slots__ = ('counts', 'total')
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.total = 0.0
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """
+    A metrics sink which aggregates per-flag evaluation counts, error code counts and per-phase latency
+    histograms in memory.
+
+    Use :func:`to_prometheus_text` to export the collected metrics.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.__buckets = tuple(sorted(buckets))
+        self.__lock = threading.Lock()
+        self.__evaluations: Dict[str, int] = {}
+        self.__errors: Dict[ErrorCode, int] = {}
+        self.__histograms = {phase: _HistogramState(len(self.__buckets) + 1) for phase in PHASES}
+
+    def record_context_conversion(self, duration: float):
+        index = bisect_left(self.__buckets, duration)
+        with self.__lock:
+            histogram = self.__histograms[PHASE_CONTEXT_CONVERSION]
+            histogram.counts[index] += 1
+            histogram.total += duration
+
+    def record_evaluation(self, flag_key: str, error_code: Optional[ErrorCode], evaluation_duration: float,
+                          details_duration: float):
+        evaluation_index = bisect_left(self.__buckets, evaluation_duration)
+        details_index = bisect_left(self.__buckets, details_duration)
+        with self.__lock:
+            self.__evaluations[flag_key] = self.__evaluations.get(flag_key, 0) + 1
+            if error_code is not None:
+                self.__errors[error_code] = self.__errors.get(error_code, 0) + 1
+
+            histogram = self.__histograms[PHASE_SDK_EVALUATION]
+            histogram.counts[evaluation_index] += 1
+            histogram.total += evaluation_duration
+
+            histogram = self.__histograms[PHASE_DETAILS_CONVERSION]
+            histogram.counts[details_index] += 1
+            histogram.total += details_duration
+
+    @property
+    def evaluation_counts(self) -> Dict[str, int]:
+        """The number of evaluations recorded for each flag key."""
+        with self.__lock:
+            return dict(self.__evaluations)
+
+    @property
+    def error_counts(self) -> Dict[ErrorCode, int]:
+        """The number of evaluations recorded for each error code."""
+        with self.__lock:
+            return dict(self.__errors)
+
+    def histogram(self, phase: str) -> Histogram:
+        """Retrieve a snapshot of the latency histogram for one of the :data:`PHASES`."""
+        with self.__lock:
+            state = self.__histograms[phase]
+            return Histogram(self.__buckets, list(state.counts), state.total)
+
+
+def to_prometheus_text(sink: InMemoryMetricsSink, prefix: str = 'launchdarkly_openfeature') -> str:
+    """Renders the metrics collected by the sink in the Prometheus text exposition format."""
+    lines: List[str] = []
+
+    name = '%s_evaluations_total' % prefix
+    lines.append('# HELP %s Number of flag evaluations.' % name)
+    lines.append('# TYPE %s counter' % name)
+    for flag_key, count in sorted(sink.evaluation_counts.items()):
+        lines.append('%s{flag_key="%s"} %d' % (name, _escape(flag_key), count))
+
+    name = '%s_evaluation_errors_total' % prefix
+    lines.append('# HELP %s Number of flag evaluations which resulted in an error.' % name)
+    lines.append('# TYPE %s counter' % name)
+    for error_code, count in sorted(sink.error_counts.items(), key=lambda item: item[0].value):
+        lines.append('%s{error_code="%s"} %d' % (name, error_code.value, count))
+
+    name = '%s_phase_duration_seconds' % prefix
+    lines.append('# HELP %s Time spent in each phase of a flag evaluation.' % name)
+    lines.append('# TYPE %s histogram' % name)
+    for phase in PHASES:
+        histogram = sink.histogram(phase)
+        cumulative = 0
+        for bound, count in zip(histogram.buckets, histogram.counts):
+            cumulative += count
+            lines.append('%s_bucket{phase="%s",le="%s"} %d' % (name, phase, repr(bound), cumulative))
+        lines.append('%s_bucket{phase="%s",le="+Inf"} %d' % (name, phase, histogram.count))
+        lines.append('%s_sum{phase="%s"} %s' % (name, phase, repr(histogram.sum)))
+        lines.append('%s_count{phase="%s"} %d' % (name, phase, histogram.count))
+
+    return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
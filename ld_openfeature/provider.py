@@ -1,27 +1,239 @@
+import asyncio
+import multiprocessing
+import os
+import shutil
+import tempfile
 import threading
-from typing import Any, List, Mapping, Optional, Sequence, Union
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from logging import getLogger
+from multiprocessing.context import BaseContext
+from time import perf_counter
+from typing import Any, Callable, Deque, Dict, Generator, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 
 from ldclient.evaluation import EvaluationDetail
-from ldclient import LDClient, Config
+from ldclient import LDClient, Config, Context
 from ldclient.interfaces import DataSourceStatus, FlagChange, DataSourceState
+from ldclient.versioned_data_kind import FEATURES
 from openfeature.evaluation_context import EvaluationContext
-from openfeature.exception import ErrorCode, ProviderFatalError
+from openfeature.exception import ErrorCode, ProviderFatalError, ProviderNotReadyError
 from openfeature.flag_evaluation import FlagResolutionDetails, FlagType, FlagValueType, Reason
 from openfeature.hook import Hook
 from openfeature.provider.metadata import Metadata
 from openfeature.provider import AbstractProvider
 from openfeature.event import ProviderEventDetails
 
-from ld_openfeature.impl.context_converter import EvaluationContextConverter
+from ld_openfeature.impl.cache import CacheStats
+from ld_openfeature.impl.change_coalescer import FlagChangeCoalescer
+from ld_openfeature.impl.context_cache import CachingEvaluationContextConverter
+from ld_openfeature.impl.context_converter import ContextConverter, EvaluationContextConverter
+from ld_openfeature.impl import process_worker
 from ld_openfeature.impl.details_converter import ResolutionDetailsConverter
+from ld_openfeature.impl.flag_metadata import EMPTY_METADATA, FlagMetadata, FlagMetadataCache
+from ld_openfeature.impl.passthrough_context_converter import PassthroughContextConverter
+from ld_openfeature.impl.result_cache import EvaluationResultCache, result_key
+from ld_openfeature.impl.snapshot import SnapshotWriter, load_snapshot, write_snapshot
+from ld_openfeature.impl.timed_context_converter import TimedEvaluationContextConverter
+from ld_openfeature.impl.value_types import ValueCast, cast_boolean, cast_float, cast_for, cast_integer, \
+    cast_object, cast_string
+from ld_openfeature.metrics import MetricsSink
+from ld_openfeature.read_through_store import ReadThroughFeatureStore
+from ld_openfeature.scope import EvaluationScope, Evaluator
+from ld_openfeature.shared_client import SharedClient
 
+logger = getLogger("launchdarkly-openfeature-server")
 
-class LaunchDarklyProvider(AbstractProvider):
-    def __init__(self, config: Config):
-        self.__client = LDClient(config)
 
-        self.__context_converter = EvaluationContextConverter()
-        self.__details_converter = ResolutionDetailsConverter()
+def _worker_process_context() -> BaseContext:
+    # A forkserver starts workers from a clean process, but is not available on every platform.
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return multiprocessing.get_context(method)
+
+
+class LaunchDarklyProvider(AbstractProvider):
+    def __init__(self, config: Union[Config, SharedClient], context_cache_size: int = 0, start_wait: Optional[float] = None,
+                 reuse_resolution_details: bool = False, metrics_sink: Optional[MetricsSink] = None,
+                 snapshot_path: Optional[str] = None, snapshot_interval: float = 60,
+                 flag_change_max_delay: float = 0, flag_change_max_batch_size: Optional[int] = None,
+                 include_flag_metadata: bool = False, result_cache_size: int = 0,
+                 context_log_interval: float = 60, client: Optional[LDClient] = None,
+                 context_validation: str = 'permissive', warmup_flags: Sequence[str] = (),
+                 warmup_contexts: Sequence[EvaluationContext] = (), context_kind_cache_size: int = 0):
+        """
+        :param config: The LaunchDarkly SDK configuration used to create the underlying client, or a
+            :class:`ld_openfeature.SharedClient` whose client is shared with other providers. A shared client is
+            released, rather than closed, when the provider shuts down.
+        :param context_cache_size: The maximum number of converted evaluation contexts to retain. When greater
+            than zero, the result of converting an EvaluationContext into a LaunchDarkly context is cached so
+            repeated evaluations for the same context do not convert it again. Defaults to 0, which disables
+            the cache.
+        :param start_wait: The maximum number of seconds :func:`initialize` will wait for the client to
+            initialize. When the wait elapses the provider reports that it is not ready and continues to
+            initialize in the background, emitting a ready event once the data source becomes valid. The client
+            is created without waiting, so constructing the provider never blocks; the wait happens in
+            :func:`initialize` or :func:`initialize_async`. Defaults to None, which waits indefinitely.
+        :param reuse_resolution_details: When True, resolution details for scalar flag values are shared between
+            evaluations producing the same value, variant and reason instead of being allocated per evaluation.
+            The returned details must then be treated as immutable. Defaults to False.
+        :param metrics_sink: A sink which receives evaluation counts, error codes and per-phase latencies, such
+            as :class:`ld_openfeature.metrics.InMemoryMetricsSink`. Evaluations served from the result cache (see
+            ``result_cache_size``) are counted too, with the cache lookup recorded as their SDK evaluation latency
+            and no context conversion. Defaults to None, which disables instrumentation.
+        :param snapshot_path: The path of a flag snapshot file. When set, the provider starts from the flags in
+            the snapshot if it exists, so evaluations can be served immediately while the client connects to
+            LaunchDarkly and then switches over to live updates. Once initialized, the provider rewrites the
+            snapshot every ``snapshot_interval`` seconds and on shutdown. A snapshot is not loaded into a feature
+            store which is already initialized, such as a populated persistent store. The file is written with
+            permissions allowing only its owner to read it. Defaults to None.
+        :param snapshot_interval: The number of seconds between snapshot writes. Defaults to 60.
+        :param flag_change_max_delay: When greater than zero, flag changes are buffered for up to this many
+            seconds and reported in a single configuration changed event listing every changed flag. Defaults to
+            0, which emits one event per changed flag.
+        :param flag_change_max_batch_size: The maximum number of flags reported in one configuration changed
+            event when changes are buffered. A full batch is reported immediately. Defaults to None, which does
+            not limit the batch size.
+        :param include_flag_metadata: When True, resolution details carry flag metadata: the flag ``version``,
+            whether the evaluation is tracked (``trackEvents``), and when applicable the matched ``ruleId`` and
+            ``ruleIndex`` and whether the evaluation is part of an experiment (``inExperiment``). The metadata is
+            built once per flag version and evaluation reason and shared between evaluations, so it must not be
+            modified. With ``use_ldd``, the flag's version is read for each evaluation, as changes written to the
+            store by another process are not reported to the provider. Defaults to False.
+        :param result_cache_size: The maximum number of evaluation results to retain. When greater than zero, the
+            resolution details for a flag, evaluation context and default value are cached until the flag changes,
+            so repeated evaluations skip both context conversion and flag evaluation. Because a cached result does
+            not generate an analytics event, the cache is only used when the client does not send events
+            (``send_events=False`` or ``offline=True``); otherwise a warning is logged and the cache is disabled.
+            Cached results are still counted by ``metrics_sink``. The cache is also disabled, with a warning, when
+            ``use_ldd`` is set, as flags are then written to the feature store by another process, such as the Relay
+            Proxy, without the provider being told of the change. Error results are not cached. Only changes to a
+            flag, or to a segment it uses, invalidate its cached results. A result which depends on big segment
+            membership, or on time-based targeting that changes the outcome without a change to the flag, can remain
+            cached after it would have changed, until the flag next changes or the entry is evicted. Defaults to 0,
+            which disables the cache.
+        :param context_log_interval: The minimum number of seconds between repeats of the same log message about
+            an invalid evaluation context. Repeats within the interval are counted instead of logged, and the
+            count is reported once the interval has elapsed, or when the provider is shut down. Defaults to 60; 0
+            logs every occurrence.
+        :param client: An existing client to evaluate with instead of creating one. ``config`` must be the
+            configuration the client was created with. The caller remains responsible for closing the client; the
+            provider does not close it on shutdown. Defaults to None.
+        :param context_validation: How the types of the ``name``, ``anonymous`` and ``privateAttributes``
+            attributes of evaluation contexts are checked. ``'permissive'`` checks every context as it is
+            converted, logging and discarding invalid values. ``'strict'`` logs the same problems but rejects the
+            whole context, so the evaluation fails. Both check each attribute in the same pass that copies it into
+            the converted context, so strict is no slower than permissive. ``'trusted'`` skips the checks, and
+            should only be used when every evaluation context is known to be well formed. Defaults to
+            ``'permissive'``.
+        :param warmup_flags: Keys of flags to load from the feature store once the client has initialized, before
+            :func:`initialize` returns, so that the first evaluations of these flags do not pay the cost of a
+            cold store or metadata cache. :func:`initialize_async` runs the warm-up off the event loop. When the
+            client does not initialize within ``start_wait``, the warm-up runs once it does, before the provider
+            reports that it is ready. Defaults to no flags.
+        :param warmup_contexts: Representative evaluation contexts to convert and evaluate every flag against once
+            the client has initialized, at the same time as ``warmup_flags`` are loaded. This warms the context
+            cache and the flag and segment data used by evaluations. The evaluations are made with
+            :func:`ldclient.client.LDClient.all_flags_state`, so they do not generate analytics events. Defaults to
+            no contexts.
+        :param context_kind_cache_size: The maximum number of converted kinds of multi-kind evaluation contexts to
+            retain. When greater than zero, a kind whose attributes are unchanged since it was last converted, such
+            as an org shared by many users, is reused when converting a multi-kind context rather than converted
+            again. This complements ``context_cache_size``, which only helps when the whole context repeats.
+            Defaults to 0, which disables the cache.
+        """
+        shared_client: Optional[SharedClient] = None
+        if isinstance(config, SharedClient):
+            shared_client = config
+            config = shared_client.config
+
+        self.__config = config
+        self.__start_wait = start_wait
+
+        if snapshot_path is not None:
+            load_snapshot(config.feature_store, snapshot_path)
+
+        # Called on shutdown to give up the client; None when the client is owned by the caller.
+        self.__release_client: Optional[Callable[[], None]]
+        if client is not None:
+            self.__client = client
+            self.__release_client = None
+        elif shared_client is not None:
+            self.__client = shared_client.acquire(start_wait=0)
+            self.__release_client = shared_client.release
+        else:
+            # The client does not wait for initialization, so that constructing the provider never blocks, for
+            # example on an event loop; initialize and initialize_async wait instead.
+            self.__client = LDClient(config, start_wait=0)
+            self.__release_client = self.__client.close
+
+        self.__snapshot_writer: Optional[SnapshotWriter] = None
+        if snapshot_path is not None:
+            self.__snapshot_writer = SnapshotWriter(config.feature_store, snapshot_path, snapshot_interval,
+                                                    self.__client.is_initialized)
+            self.__snapshot_writer.start()
+
+        self.__context_validation = context_validation
+        self.__context_log_interval = context_log_interval
+        self.__base_context_converter = EvaluationContextConverter(log_interval=context_log_interval,
+                                                                   validation=context_validation,
+                                                                   kind_cache_size=context_kind_cache_size)
+        self.__context_converter: ContextConverter = self.__base_context_converter
+
+        self.__context_cache: Optional[CachingEvaluationContextConverter] = None
+        if context_cache_size > 0:
+            self.__context_cache = CachingEvaluationContextConverter(self.__base_context_converter,
+                                                                     context_cache_size)
+            self.__context_converter = self.__context_cache
+
+        self.__metrics_sink = metrics_sink
+        if metrics_sink is not None:
+            self.__context_converter = TimedEvaluationContextConverter(self.__context_converter, metrics_sink)
+
+        # Outermost, so that a carried LaunchDarkly context skips the cache lookup and timing as well as conversion.
+        self.__context_converter = PassthroughContextConverter(self.__context_converter)
+
+        self.__details_converter = ResolutionDetailsConverter(reuse_results=reuse_resolution_details)
+
+        self.__flag_metadata: Optional[FlagMetadataCache] = None
+        if include_flag_metadata:
+            feature_store = config.feature_store
+            # With use_ldd, flag changes are written to the store by another process without being reported.
+            self.__flag_metadata = FlagMetadataCache(lambda key: feature_store.get(FEATURES, key, lambda flag: flag),
+                                                     check_versions=config.use_ldd)
+
+        self.__result_cache: Optional[EvaluationResultCache] = None
+        if result_cache_size > 0:
+            if config.send_events and not config.offline:
+                logger.warning("The evaluation result cache is disabled because analytics events are enabled; "
+                               "set send_events=False to use it")
+            elif config.use_ldd:
+                logger.warning("The evaluation result cache is disabled because use_ldd is set; flag changes "
+                               "written to the feature store by another process are not reported to the provider")
+            else:
+                self.__result_cache = EvaluationResultCache(result_cache_size)
+
+        if self.__flag_metadata is not None or self.__result_cache is not None:
+            # Registered separately from the event listeners as cached data must be refreshed even before the
+            # provider is initialized.
+            self.__client.flag_tracker.add_listener(self.__invalidate_flag_caches)
+
+        self.__flag_change_coalescer: Optional[FlagChangeCoalescer] = None
+        if flag_change_max_delay > 0:
+            self.__flag_change_coalescer = FlagChangeCoalescer(self.__emit_flags_changed, flag_change_max_delay,
+                                                               flag_change_max_batch_size)
+
+        self.__warmup_flags = tuple(warmup_flags)
+        self.__warmup_contexts = tuple(warmup_contexts)
+
+        self.__listener_lock = threading.Lock()
+        self.__listening = False
+        self.__warmed_up = False
+
+        # The evaluation pipeline is selected once, so evaluations do not check the provider's options.
+        self.__evaluator: Evaluator = self.__evaluate if metrics_sink is None else self.__evaluate_timed
+        self.__resolver: Callable[[ValueCast, str, Any, Optional[EvaluationContext]], FlagResolutionDetails] = \
+            self.__resolve_value if self.__result_cache is None else self.__resolve_cached_value
 
     @property
     def client(self) -> LDClient:
@@ -32,11 +244,66 @@ class LaunchDarklyProvider(AbstractProvider):
         """
         return self.__client
 
+    @property
+    def context_cache_stats(self) -> Optional[CacheStats]:
+        """
+        Retrieve the hit, miss and eviction counters of the context conversion cache.
+
+        Returns None if the provider was created without a context cache.
+        """
+        if self.__context_cache is None:
+            return None
+        return self.__context_cache.stats
+
+    @property
+    def context_kind_cache_stats(self) -> Optional[CacheStats]:
+        """
+        Retrieve the hit, miss and eviction counters of the cache of converted kinds of multi-kind contexts.
+
+        Returns None if the provider was created without a kind cache.
+        """
+        return self.__base_context_converter.kind_cache_stats
+
+    @property
+    def result_cache_stats(self) -> Optional[CacheStats]:
+        """
+        Retrieve the hit, miss and eviction counters of the evaluation result cache.
+
+        Returns None if the provider was created without a result cache, or if the cache was disabled because
+        analytics events are enabled.
+        """
+        if self.__result_cache is None:
+            return None
+        return self.__result_cache.stats
+
+    @property
+    def store_cache_stats(self) -> Optional[CacheStats]:
+        """
+        Retrieve the hit, miss and eviction counters of the in-process cache of flags and segments.
+
+        Returns None unless the client's feature store is a :class:`ld_openfeature.ReadThroughFeatureStore`.
+        """
+        feature_store = self.__config.feature_store
+        if not isinstance(feature_store, ReadThroughFeatureStore):
+            return None
+        return feature_store.stats
+
+    @property
+    def context_conversion_log_counts(self) -> Dict[str, int]:
+        """
+        Retrieve the number of times each message about an invalid evaluation context has been logged, including
+        repeats which were suppressed by ``context_log_interval``.
+        """
+        return self.__base_context_converter.log_counts
+
     def __handle_data_source_status(self, status: DataSourceStatus):
         state = status.state
         if state == DataSourceState.INITIALIZING:
             return
         elif state == DataSourceState.VALID:
+            # When initialization timed out, the warm-up is run once the client becomes ready, before reporting it.
+            if self.__client.is_initialized() and self.__claim_warm_up():
+                self.__warm_up()
             self.emit_provider_ready(ProviderEventDetails())
         elif state == DataSourceState.OFF:
             error_message = self.__get_message(status,
@@ -50,43 +317,147 @@ class LaunchDarklyProvider(AbstractProvider):
         # For now treat an unknown state as no change.
 
     def __handle_flag_change(self, change: FlagChange):
-        self.emit_provider_configuration_changed(ProviderEventDetails(flags_changed=[change.key]))
-        pass
+        if self.__flag_change_coalescer is not None:
+            self.__flag_change_coalescer.add(change.key)
+        else:
+            self.__emit_flags_changed([change.key])
+
+    def __invalidate_flag_caches(self, change: FlagChange):
+        if self.__flag_metadata is not None:
+            self.__flag_metadata.invalidate(change.key)
+        if self.__result_cache is not None:
+            self.__result_cache.invalidate(change.key)
+
+    def __emit_flags_changed(self, flag_keys: List[str]):
+        self.emit_provider_configuration_changed(ProviderEventDetails(flags_changed=flag_keys))
 
     def initialize(self, evaluation_context: EvaluationContext):
         ready_event = threading.Event()
+        ready_handler = self.__add_ready_handler(ready_event.set)
+
+        try:
+            ready = ready_event.wait(self.__start_wait)
+        finally:
+            self.__client.data_source_status_provider.remove_listener(ready_handler)
+
+        self.__complete_initialization(ready)
+        if self.__claim_warm_up():
+            self.__warm_up()
 
+    async def initialize_async(self, evaluation_context: EvaluationContext):
+        """
+        Waits for the underlying client to initialize without blocking the running event loop.
+
+        Readiness is signalled by the same data source status events used by :func:`initialize`, and the wait is
+        bounded by the provider's ``start_wait``. Awaiting this method before registering the provider with
+        OpenFeature allows the subsequent (synchronous) initialization performed by the OpenFeature API to
+        complete immediately.
+        """
+        loop = asyncio.get_running_loop()
+        ready_event = asyncio.Event()
+        ready_handler = self.__add_ready_handler(lambda: loop.call_soon_threadsafe(ready_event.set))
+
+        ready = True
+        try:
+            await asyncio.wait_for(ready_event.wait(), self.__start_wait)
+        except asyncio.TimeoutError:
+            ready = False
+        finally:
+            self.__client.data_source_status_provider.remove_listener(ready_handler)
+
+        self.__complete_initialization(ready)
+        if self.__claim_warm_up():
+            # The warm-up reads the feature store and evaluates flags, so it is run off the event loop.
+            await loop.run_in_executor(None, self.__warm_up)
+
+    def __add_ready_handler(self, on_ready: Callable[[], Any]) -> Callable[[DataSourceStatus], None]:
+        """
+        Registers a data source status listener which invokes on_ready once the client has either initialized
+        or permanently failed. The listener is returned so the caller can remove it.
+        """
         def ready_handler(status: DataSourceStatus):
             if status.state == DataSourceState.VALID:
-                ready_event.set()
+                on_ready()
             elif status.state == DataSourceState.OFF:
-                ready_event.set()
+                on_ready()
 
         # We listen just to handle the ready event. We do not emit events because the client emits them for us.
         self.__client.data_source_status_provider.add_listener(ready_handler)
 
         # Check for conditions that may have happened before we added the listener.
         if self.__client.data_source_status_provider.status.state == DataSourceState.OFF:
-            ready_event.set()
+            on_ready()
 
         if self.__client.is_initialized():
-            ready_event.set()
+            on_ready()
+
+        return ready_handler
 
-        ready_event.wait()
+    def __complete_initialization(self, ready: bool):
+        if ready and not self.__client.is_initialized():
+            raise ProviderFatalError(error_message="launchdarkly client initialization failed")
 
-        self.__client.data_source_status_provider.remove_listener(ready_handler)
+        # Both initialize and initialize_async may be called for the same provider; only listen once.
+        with self.__listener_lock:
+            if not self.__listening:
+                self.__listening = True
 
+                # Listen to new status events and emit them. When initialization timed out this is also how the
+                # provider reports that it later became ready.
+                self.__client.data_source_status_provider.add_listener(self.__handle_data_source_status)
+                self.__client.flag_tracker.add_listener(self.__handle_flag_change)
+
+        # The client may have finished initializing between the wait timing out and the listener being added.
         if not self.__client.is_initialized():
-            raise ProviderFatalError(error_message="launchdarkly client initialization failed")
+            raise ProviderNotReadyError(error_message="launchdarkly client did not initialize within "
+                                                      "the start wait; initialization continues in the background")
 
-        # Listen to new status events and emit them.
-        self.__client.data_source_status_provider.add_listener(self.__handle_data_source_status)
-        self.__client.flag_tracker.add_listener(self.__handle_flag_change)
+    def __claim_warm_up(self) -> bool:
+        """Returns True for the first caller only, which is then responsible for warming up the provider."""
+        with self.__listener_lock:
+            warm_up = not self.__warmed_up
+            self.__warmed_up = True
+        return warm_up
+
+    def __warm_up(self):
+        """
+        Exercises the evaluation path for the configured warmup flags and contexts without generating analytics
+        events. Failures are logged rather than failing initialization.
+        """
+        try:
+            feature_store = self.__config.feature_store
+            for flag_key in self.__warmup_flags:
+                feature_store.get(FEATURES, flag_key, lambda flag: flag)
+
+            for evaluation_context in self.__warmup_contexts:
+                ld_context = self.__context_converter.to_ld_context(evaluation_context)
+                state = self.__client.all_flags_state(ld_context, with_reasons=True)
+                if self.__flag_metadata is None or not state.valid:
+                    continue
+
+                for flag_key in self.__warmup_flags:
+                    reason = state.get_flag_reason(flag_key)
+                    if reason is not None:
+                        self.__flag_metadata.get(flag_key, reason)
+        except Exception as e:
+            logger.warning("Warming up the provider failed: %s", e)
 
     def shutdown(self):
+        if self.__snapshot_writer is not None:
+            self.__snapshot_writer.stop()
+            self.__snapshot_writer.write()
+
         self.__client.data_source_status_provider.remove_listener(self.__handle_data_source_status)
         self.__client.flag_tracker.remove_listener(self.__handle_flag_change)
-        self.__client.close()
+        self.__client.flag_tracker.remove_listener(self.__invalidate_flag_caches)
+        if self.__flag_change_coalescer is not None:
+            self.__flag_change_coalescer.flush()
+        self.__base_context_converter.close()
+
+        # Only give up the client once, even if the provider is shut down repeatedly.
+        release_client, self.__release_client = self.__release_client, None
+        if release_client is not None:
+            release_client()
 
     def get_metadata(self) -> Metadata:
         return Metadata("launchdarkly-openfeature-server")
@@ -101,7 +472,7 @@ class LaunchDarklyProvider(AbstractProvider):
         evaluation_context: Optional[EvaluationContext] = None,
     ) -> FlagResolutionDetails[bool]:
         """Resolves the flag value for the provided flag key as a boolean"""
-        return self.__resolve_value(FlagType(FlagType.BOOLEAN), flag_key, default_value, evaluation_context)
+        return self.__resolver(cast_boolean, flag_key, default_value, evaluation_context)
 
     def resolve_string_details(
         self,
@@ -110,7 +481,7 @@ class LaunchDarklyProvider(AbstractProvider):
         evaluation_context: Optional[EvaluationContext] = None,
     ) -> FlagResolutionDetails[str]:
         """Resolves the flag value for the provided flag key as a string"""
-        return self.__resolve_value(FlagType(FlagType.STRING), flag_key, default_value, evaluation_context)
+        return self.__resolver(cast_string, flag_key, default_value, evaluation_context)
 
     def resolve_integer_details(
         self,
@@ -119,7 +490,7 @@ class LaunchDarklyProvider(AbstractProvider):
         evaluation_context: Optional[EvaluationContext] = None,
     ) -> FlagResolutionDetails[int]:
         """Resolves the flag value for the provided flag key as a integer"""
-        return self.__resolve_value(FlagType(FlagType.INTEGER), flag_key, default_value, evaluation_context)
+        return self.__resolver(cast_integer, flag_key, default_value, evaluation_context)
 
     def resolve_float_details(
         self,
@@ -128,7 +499,7 @@ class LaunchDarklyProvider(AbstractProvider):
         evaluation_context: Optional[EvaluationContext] = None,
     ) -> FlagResolutionDetails[float]:
         """Resolves the flag value for the provided flag key as a float"""
-        return self.__resolve_value(FlagType(FlagType.FLOAT), flag_key, default_value, evaluation_context)
+        return self.__resolver(cast_float, flag_key, default_value, evaluation_context)
 
     def resolve_object_details(
         self,
@@ -139,45 +510,287 @@ class LaunchDarklyProvider(AbstractProvider):
         evaluation_context: Optional[EvaluationContext] = None,
     ) -> FlagResolutionDetails[Union[dict, list]]:
         """Resolves the flag value for the provided flag key as a list or dictionary"""
-        return self.__resolve_value(FlagType(FlagType.OBJECT), flag_key, default_value, evaluation_context)
+        return self.__resolver(cast_object, flag_key, default_value, evaluation_context)
 
-    def __resolve_value(self, flag_type: FlagType, flag_key: str, default_value: Any,
-                        evaluation_context: Optional[EvaluationContext] = None) -> FlagResolutionDetails:
+    def scope(self, evaluation_context: Union[EvaluationContext, Context]) -> EvaluationScope:
+        """
+        Creates a scope which evaluates flags against a single context.
+
+        The evaluation context is converted into a LaunchDarkly context once, when the scope is created, and
+        reused by every evaluation made through the scope. An already built :class:`ldclient.Context` may be
+        provided instead, in which case no conversion takes place.
+
+        .. code-block:: python
+
+            with provider.scope(evaluation_context) as scope:
+                enabled = scope.resolve_boolean_details("my-flag", False).value
+        """
+        if isinstance(evaluation_context, Context):
+            ld_context = evaluation_context
+        else:
+            ld_context = self.__context_converter.to_ld_context(evaluation_context)
+
+        return EvaluationScope(self.__evaluator, ld_context)
+
+    def resolve_many(
+        self,
+        flag_specs: Iterable[Tuple[str, FlagType, Any]],
+        evaluation_context: Optional[EvaluationContext] = None,
+    ) -> Dict[str, FlagResolutionDetails]:
+        """
+        Resolves several flags for the same evaluation context in a single call.
+
+        The evaluation context is converted only once and reused for every flag. Each flag specification is a
+        tuple of the flag key, the expected :class:`openfeature.flag_evaluation.FlagType`, and the default
+        value. The results are keyed by flag key; if a key is repeated, the last specification wins.
+        """
         if evaluation_context is None:
-            return FlagResolutionDetails(
-                value=default_value,
-                reason=Reason(Reason.ERROR),
-                error_code=ErrorCode.TARGETING_KEY_MISSING
+            return {flag_key: self.__missing_context_details(default_value)
+                    for flag_key, _, default_value in flag_specs}
+
+        ld_context = self.__context_converter.to_ld_context(evaluation_context)
+        return {flag_key: self.__evaluator(cast_for(flag_type), flag_key, default_value, ld_context)
+                for flag_key, flag_type, default_value in flag_specs}
+
+    def resolve_for_contexts(
+        self,
+        flag_key: str,
+        flag_type: FlagType,
+        default_value: Any,
+        evaluation_contexts: Iterable[Optional[EvaluationContext]],
+        max_workers: int = 0,
+        chunk_size: int = 256,
+    ) -> Generator[FlagResolutionDetails, None, None]:
+        """
+        Resolves a single flag for each of many evaluation contexts, yielding the results in the same order as
+        the contexts.
+
+        This is intended for batch jobs evaluating one flag against a large population. The contexts are
+        consumed lazily, so very large or unbounded iterables may be used. When max_workers is greater than zero,
+        contexts are split into chunks of chunk_size which are converted and evaluated on a thread pool of that
+        size; at most two chunks per worker are in flight at any time.
+
+        :param flag_key: The key of the flag to resolve.
+        :param flag_type: The expected :class:`openfeature.flag_evaluation.FlagType` of the flag.
+        :param default_value: The value to use if the flag cannot be evaluated.
+        :param evaluation_contexts: The contexts to evaluate the flag against.
+        :param max_workers: The number of threads to evaluate on. Defaults to 0, which evaluates on the calling
+            thread.
+        :param chunk_size: The number of contexts handed to a worker at a time.
+        """
+        cast = cast_for(flag_type)
+        resolver = self.__resolver
+        if max_workers <= 0:
+            for evaluation_context in evaluation_contexts:
+                yield resolver(cast, flag_key, default_value, evaluation_context)
+            return
+
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+
+        def resolve_chunk(chunk: List[Optional[EvaluationContext]]) -> List[FlagResolutionDetails]:
+            return [resolver(cast, flag_key, default_value, evaluation_context)
+                    for evaluation_context in chunk]
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ld-openfeature-batch")
+        yield from self.__map_chunks(executor, max_workers, resolve_chunk, evaluation_contexts, chunk_size)
+
+    def resolve_for_contexts_in_processes(
+        self,
+        flag_key: str,
+        flag_type: FlagType,
+        default_value: Any,
+        evaluation_contexts: Iterable[Optional[EvaluationContext]],
+        processes: Optional[int] = None,
+        chunk_size: int = 256,
+    ) -> Generator[FlagResolutionDetails, None, None]:
+        """
+        Resolves a single flag for each of many evaluation contexts using a pool of worker processes, yielding
+        the results in the same order as the contexts.
+
+        This behaves like :func:`resolve_for_contexts`, but is not limited by the global interpreter lock. The
+        provider writes a snapshot of its current flag data to a temporary file once, and each worker process
+        evaluates against a client loaded from that snapshot, so workers never open their own connection to
+        LaunchDarkly. Flag changes made after the snapshot is taken are not seen by the workers, and evaluations
+        made by the workers do not generate analytics events.
+
+        :param flag_key: The key of the flag to resolve.
+        :param flag_type: The expected :class:`openfeature.flag_evaluation.FlagType` of the flag.
+        :param default_value: The value to use if the flag cannot be evaluated.
+        :param evaluation_contexts: The contexts to evaluate the flag against. Contexts must be picklable.
+        :param processes: The number of worker processes. Defaults to None, which uses the number of processors.
+        :param chunk_size: The number of contexts handed to a worker at a time.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+
+        # A private directory, so that no other user can read the snapshot or replace it before the workers do.
+        snapshot_dir = tempfile.mkdtemp(prefix="ld-openfeature-snapshot-")
+        snapshot_path = os.path.join(snapshot_dir, "snapshot.json")
+        try:
+            write_snapshot(self.__config.feature_store, snapshot_path)
+
+            # Workers are not forked, as forking a process with running client threads can deadlock the child.
+            executor = ProcessPoolExecutor(max_workers=processes, mp_context=_worker_process_context(),
+                                           initializer=process_worker.initialize_worker,
+                                           initargs=(self.__config.sdk_key, snapshot_path, self.__context_validation,
+                                                     self.__context_log_interval))
+            resolve_chunk = partial(process_worker.resolve_chunk, flag_key, flag_type, default_value)
+            max_in_flight = processes if processes is not None else (os.cpu_count() or 1)
+
+            yield from self.__map_chunks(executor, max_in_flight, resolve_chunk, evaluation_contexts, chunk_size)
+        finally:
+            shutil.rmtree(snapshot_dir, ignore_errors=True)
+
+    @staticmethod
+    def __map_chunks(
+        executor: Executor,
+        workers: int,
+        resolve_chunk: Callable[[List[Optional[EvaluationContext]]], List[FlagResolutionDetails]],
+        evaluation_contexts: Iterable[Optional[EvaluationContext]],
+        chunk_size: int,
+    ) -> Generator[FlagResolutionDetails, None, None]:
+        """
+        Submits chunks of contexts to the executor, keeping at most two chunks per worker in flight, and yields
+        the results in order. The executor is shut down once the results are exhausted or abandoned.
+        """
+        contexts = iter(evaluation_contexts)
+        pending: Deque[Future] = deque()
+        try:
+            while True:
+                chunk = list(islice(contexts, chunk_size))
+                if not chunk:
+                    break
+
+                pending.append(executor.submit(resolve_chunk, chunk))
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # If the caller stops consuming results early, do not evaluate chunks which have not started.
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def resolve_all_flags(
+        self,
+        evaluation_context: Optional[EvaluationContext] = None,
+        client_side_only: bool = False,
+    ) -> Dict[str, FlagResolutionDetails]:
+        """
+        Resolves every flag for the provided evaluation context in a single pass.
+
+        This is built on :func:`ldclient.client.LDClient.all_flags_state` and is intended for bootstrapping
+        client-side applications. Flag values are returned as stored, without type validation, and no analytics
+        events are generated. An empty mapping is returned if no context is provided, or if the flag state
+        could not be computed (for instance because the client is offline, not yet initialized, or the context
+        is invalid).
+
+        :param evaluation_context: The context to evaluate the flags against.
+        :param client_side_only: If True, only flags marked for use with client-side SDKs are included.
+        """
+        if evaluation_context is None:
+            return {}
+
+        ld_context = self.__context_converter.to_ld_context(evaluation_context)
+        state = self.__client.all_flags_state(ld_context, with_reasons=True, client_side_only=client_side_only)
+        if not state.valid:
+            return {}
+
+        state_dict = state.to_json_dict()
+        flags_metadata = state_dict['$flagsState']
+
+        results: Dict[str, FlagResolutionDetails] = {}
+        for flag_key, flag_metadata in flags_metadata.items():
+            detail = EvaluationDetail(
+                value=state_dict[flag_key],
+                variation_index=flag_metadata.get('variation'),
+                reason=flag_metadata.get('reason') or {},
             )
+            results[flag_key] = self.__details_converter.to_resolution_details(
+                detail, self.__get_flag_metadata(flag_key, detail))
+
+        return results
+
+    def __resolve_value(self, cast: ValueCast, flag_key: str, default_value: Any,
+                        evaluation_context: Optional[EvaluationContext] = None) -> FlagResolutionDetails:
+        if evaluation_context is None:
+            return self.__missing_context_details(default_value)
 
         ld_context = self.__context_converter.to_ld_context(evaluation_context)
+        return self.__evaluator(cast, flag_key, default_value, ld_context)
+
+    def __resolve_cached_value(self, cast: ValueCast, flag_key: str, default_value: Any,
+                               evaluation_context: Optional[EvaluationContext] = None) -> FlagResolutionDetails:
+        result_cache = self.__result_cache
+        if evaluation_context is None or result_cache is None:
+            return self.__resolve_value(cast, flag_key, default_value, evaluation_context)
+
+        key = result_key(flag_key, cast, default_value, evaluation_context)
+        if key is None:
+            return self.__resolve_value(cast, flag_key, default_value, evaluation_context)
+
+        metrics_sink = self.__metrics_sink
+        start = perf_counter() if metrics_sink is not None else 0
+        details = result_cache.get(flag_key, key, evaluation_context)
+        if details is not None:
+            if metrics_sink is not None:
+                metrics_sink.record_evaluation(flag_key, details.error_code, perf_counter() - start, 0)
+            return details
+
+        # Capture the generation before evaluating, so a flag change during the evaluation discards the result.
+        generation = result_cache.generation(flag_key)
+        details = self.__resolve_value(cast, flag_key, default_value, evaluation_context)
+        if details.error_code is None:
+            result_cache.put(key, generation, evaluation_context, details)
+
+        return details
+
+    def __evaluate(self, cast: ValueCast, flag_key: str, default_value: Any,
+                   ld_context: Context) -> FlagResolutionDetails:
         result = self.__client.variation_detail(flag_key, ld_context, default_value)
+        return self.__to_details(cast, flag_key, default_value, result)
 
-        resolved_value = self.__validate_and_cast_value(flag_type, result.value)
+    def __evaluate_timed(self, cast: ValueCast, flag_key: str, default_value: Any,
+                         ld_context: Context) -> FlagResolutionDetails:
+        metrics_sink = self.__metrics_sink
+        assert metrics_sink is not None
+
+        start = perf_counter()
+        result = self.__client.variation_detail(flag_key, ld_context, default_value)
+        evaluated = perf_counter()
+        details = self.__to_details(cast, flag_key, default_value, result)
+        metrics_sink.record_evaluation(flag_key, details.error_code, evaluated - start, perf_counter() - evaluated)
+
+        return details
+
+    def __to_details(self, cast: ValueCast, flag_key: str, default_value: Any,
+                     result: EvaluationDetail) -> FlagResolutionDetails:
+        resolved_value = cast(result.value)
         if resolved_value is None:
             return self.__mismatched_type_details(default_value)
 
-        resolved_detail = EvaluationDetail(
-            value=resolved_value,
-            variation_index=result.variation_index,
-            reason=result.reason,
-        )
+        if resolved_value is not result.value:
+            result = EvaluationDetail(
+                value=resolved_value,
+                variation_index=result.variation_index,
+                reason=result.reason,
+            )
+
+        return self.__details_converter.to_resolution_details(result, self.__get_flag_metadata(flag_key, result))
 
-        return self.__details_converter.to_resolution_details(resolved_detail)
-
-    def __validate_and_cast_value(self, flag_type: FlagType, value: Any):
-        """Serializes the raw flag value to the expected type based on flag_type."""
-        if flag_type == FlagType.BOOLEAN and isinstance(value, bool):
-                return value
-        elif flag_type == FlagType.STRING and isinstance(value, str):
-                return value
-        elif flag_type == FlagType.INTEGER and isinstance(value, (int, float)) and not isinstance(value, bool):
-                return int(value) # Float decimals are truncated to int
-        elif flag_type == FlagType.FLOAT and isinstance(value, (int, float)) and not isinstance(value, bool):
-                return float(value)
-        elif flag_type == FlagType.OBJECT and isinstance(value, (dict, list)):
-                return value
-        return None
+    def __get_flag_metadata(self, flag_key: str, result: EvaluationDetail) -> FlagMetadata:
+        if self.__flag_metadata is None:
+            return EMPTY_METADATA
+        return self.__flag_metadata.get(flag_key, result.reason)
+
+    @staticmethod
+    def __missing_context_details(default_value: Any) -> FlagResolutionDetails:
+        return FlagResolutionDetails(
+            value=default_value,
+            reason=Reason(Reason.ERROR),
+            error_code=ErrorCode.TARGETING_KEY_MISSING
+        )
 
     @staticmethod
     def __mismatched_type_details(default_value: Any) -> FlagResolutionDetails:
@@ -0,0 +1,206 @@
+import threading
+from logging import getLogger
+from time import monotonic
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from ldclient.interfaces import FeatureStore
+from ldclient.versioned_data_kind import VersionedDataKind
+
+from ld_openfeature.impl.cache import CacheStats, LRUCache
+from ld_openfeature.impl.rate_limited_log import RateLimitedLogger
+
+logger = getLogger("launchdarkly-openfeature-server")
+
+# Identifies an item of a kind, or every item of the kind when the key is None.
+_CacheKey = Tuple[str, Optional[str]]
+
+
+class _Entry:
+    __slots__ = ('value', 'version', 'loaded_at')
+
+    def __init__(self, value: Any, version: int, loaded_at: float):
+        self.value = value
+        self.version = version
+        self.loaded_at = loaded_at
+
+
+def _version(item: Any) -> int:
+    # A missing item is older than any stored item, including a deleted item's placeholder.
+    return -1 if item is None else item.get('version', 0)
+
+
+class ReadThroughFeatureStore(FeatureStore):
+    """
+    Wraps a feature store, typically a persistent store such as Redis or DynamoDB, with an in-process cache of the
+    flags and segments read from it.
+
+    Items are read from the wrapped store on first use and served from memory for ``ttl`` seconds. For a further
+    ``stale_ttl`` seconds an expired item is still served, while a background thread reads it again from the
+    wrapped store, so evaluations do not wait for the store once an item has been loaded.
+
+    Writes, such as the updates the client receives from LaunchDarkly, are passed through to the wrapped store and
+    applied to the cache. The cache is version aware: an item is never replaced by an older version of itself, even
+    when a read from the wrapped store completes after a newer version was written.
+
+    The wrapped store should be created with its own caching disabled, as this store replaces it.
+
+    .. code-block:: python
+
+        store = ReadThroughFeatureStore(Redis.new_feature_store(caching=CacheConfig.disabled()), ttl=30,
+                                        stale_ttl=300)
+        provider = LaunchDarklyProvider(Config("sdk-key", feature_store=store, use_ldd=True))
+    """
+
+    def __init__(self, store: FeatureStore, ttl: float, stale_ttl: float = 0, capacity: int = 10000,
+                 clock: Callable[[], float] = monotonic):
+        """
+        :param store: The feature store to read from and write to.
+        :param ttl: The number of seconds an item is served from the cache before it is read again.
+        :param stale_ttl: The number of seconds after ``ttl`` has elapsed during which the cached item is still
+            served while it is refreshed in the background. Defaults to 0, which reads expired items before
+            returning them.
+        :param capacity: The maximum number of cached entries. Each flag and segment is an entry, as is the set
+            of every flag or every segment. Defaults to 10000.
+        :param clock: The source of the current time, in seconds.
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be a positive number of seconds")
+        if stale_ttl < 0:
+            raise ValueError("stale_ttl must not be negative")
+
+        self.__store = store
+        self.__ttl = ttl
+        self.__max_age = ttl + stale_ttl
+        self.__clock = clock
+        self.__cache: LRUCache[_CacheKey, _Entry] = LRUCache(capacity)
+        self.__refresh_log = RateLimitedLogger(logger, 60, clock)
+
+        # Guards the write sequence, the versions of cached items and the pending refreshes.
+        self.__lock = threading.Lock()
+        # Advanced by every write, so a read can tell whether the store changed while it was in progress.
+        self.__sequence = 0
+        self.__pending: Dict[_CacheKey, VersionedDataKind] = {}
+        self.__refreshing = False
+
+    @property
+    def store(self) -> FeatureStore:
+        """The wrapped feature store."""
+        return self.__store
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        The hit, miss and eviction counters of the cache. Expired items served while they are refreshed count as
+        hits.
+        """
+        return self.__cache.stats
+
+    def get(self, kind: VersionedDataKind, key: str, callback: Callable[[Any], Any] = lambda x: x) -> Any:
+        item = self.__read(kind, key)
+        return callback(None if item is None or item.get('deleted') else item)
+
+    def all(self, kind: VersionedDataKind, callback: Callable[[Any], Any] = lambda x: x) -> Any:
+        return callback(self.__read(kind, None))
+
+    def init(self, all_data: Mapping[VersionedDataKind, Mapping[str, dict]]):
+        self.__store.init(all_data)
+        with self.__lock:
+            self.__sequence += 1
+            self.__cache.clear()
+
+    def upsert(self, kind: VersionedDataKind, item: dict):
+        self.__store.upsert(kind, item)
+        # Cached as a model object, as stores return it, so that it is not decoded again on every read.
+        self.__write(kind, item['key'], kind.decode(item))
+
+    def delete(self, kind: VersionedDataKind, key: str, version: int):
+        self.__store.delete(kind, key, version)
+        self.__write(kind, key, {'key': key, 'version': version, 'deleted': True})
+
+    @property
+    def initialized(self) -> bool:
+        return self.__store.initialized
+
+    def __getattr__(self, name: str) -> Any:
+        # Optional capabilities of the wrapped store, such as availability monitoring and describing its
+        # configuration for diagnostics, are exposed as if they were implemented by this store.
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.__store, name)
+
+    def __read(self, kind: VersionedDataKind, key: Optional[str]) -> Any:
+        cache_key = (kind.namespace, key)
+        now = self.__clock()
+        entry = self.__cache.get(cache_key, lambda cached: now - cached.loaded_at < self.__max_age)
+        if entry is None:
+            return self.__load(kind, key)
+
+        if now - entry.loaded_at >= self.__ttl:
+            self.__schedule_refresh(cache_key, kind)
+        return entry.value
+
+    def __load(self, kind: VersionedDataKind, key: Optional[str]) -> Any:
+        with self.__lock:
+            sequence = self.__sequence
+        loaded_at = self.__clock()
+
+        if key is None:
+            value = self.__store.all(kind, lambda items: items)
+        else:
+            value = self.__store.get(kind, key, lambda item: item)
+
+        cache_key = (kind.namespace, key)
+        with self.__lock:
+            if sequence != self.__sequence:
+                # The store was written while reading, so the value read may predate the write. Every item of a
+                # kind cannot be checked cheaply, while an item is only kept if it is at least as new as the
+                # cached one.
+                if key is None:
+                    return value
+                current = self.__cache.peek(cache_key)
+                if current is not None and current.version > _version(value):
+                    return value
+
+            self.__cache.put(cache_key, _Entry(value, 0 if key is None else _version(value), loaded_at))
+
+        return value
+
+    def __write(self, kind: VersionedDataKind, key: str, item: Any):
+        cache_key = (kind.namespace, key)
+        version = _version(item)
+        with self.__lock:
+            self.__sequence += 1
+            self.__cache.discard((kind.namespace, None))
+
+            current = self.__cache.peek(cache_key)
+            if current is None or current.version < version:
+                self.__cache.put(cache_key, _Entry(item, version, self.__clock()))
+
+    def __schedule_refresh(self, cache_key: _CacheKey, kind: VersionedDataKind):
+        with self.__lock:
+            if cache_key in self.__pending:
+                return
+            self.__pending[cache_key] = kind
+            if self.__refreshing:
+                return
+            self.__refreshing = True
+
+        # The thread exits once there is nothing left to refresh, so the store needs no shutdown.
+        threading.Thread(target=self.__refresh, name="ld-openfeature-store-refresh", daemon=True).start()
+
+    def __refresh(self):
+        while True:
+            with self.__lock:
+                if not self.__pending:
+                    self.__refreshing = False
+                    return
+                cache_key, kind = next(iter(self.__pending.items()))
+
+            try:
+                self.__load(kind, cache_key[1])
+            except Exception as e:
+                # The stale item continues to be served until it is older than stale_ttl.
+                self.__refresh_log.warning("Unable to refresh cached data from the feature store: %s" % e)
+            finally:
+                with self.__lock:
+                    del self.__pending[cache_key]
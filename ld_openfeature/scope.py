@@ -0,0 +1,60 @@
+from typing import Any, Callable, Mapping, Sequence, Union
+
+from ldclient import Context
+from openfeature.flag_evaluation import FlagResolutionDetails, FlagValueType
+
+from ld_openfeature.impl.value_types import ValueCast, cast_boolean, cast_float, cast_integer, cast_object, \
+    cast_string
+
+Evaluator = Callable[[ValueCast, str, Any, Context], FlagResolutionDetails]
+
+
+class EvaluationScope:
+    """
+    Evaluates flags for a single, already converted, LaunchDarkly context.
+
+    Scopes are created using :func:`ld_openfeature.LaunchDarklyProvider.scope` and are typically used for the
+    duration of a single request, so that the evaluation context is converted only once no matter how many flags
+    are evaluated.
+    """
+
+    def __init__(self, evaluator: Evaluator, ld_context: Context):
+        self.__evaluator = evaluator
+        self.__ld_context = ld_context
+
+    def __enter__(self) -> 'EvaluationScope':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    @property
+    def ld_context(self) -> Context:
+        """The LaunchDarkly context all evaluations in this scope are performed against."""
+        return self.__ld_context
+
+    def resolve_boolean_details(self, flag_key: str, default_value: bool) -> FlagResolutionDetails[bool]:
+        """Resolves the flag value for the provided flag key as a boolean"""
+        return self.__evaluator(cast_boolean, flag_key, default_value, self.__ld_context)
+
+    def resolve_string_details(self, flag_key: str, default_value: str) -> FlagResolutionDetails[str]:
+        """Resolves the flag value for the provided flag key as a string"""
+        return self.__evaluator(cast_string, flag_key, default_value, self.__ld_context)
+
+    def resolve_integer_details(self, flag_key: str, default_value: int) -> FlagResolutionDetails[int]:
+        """Resolves the flag value for the provided flag key as a integer"""
+        return self.__evaluator(cast_integer, flag_key, default_value, self.__ld_context)
+
+    def resolve_float_details(self, flag_key: str, default_value: float) -> FlagResolutionDetails[float]:
+        """Resolves the flag value for the provided flag key as a float"""
+        return self.__evaluator(cast_float, flag_key, default_value, self.__ld_context)
+
+    def resolve_object_details(
+        self,
+        flag_key: str,
+        default_value: Union[
+            Sequence[FlagValueType], Mapping[str, FlagValueType]
+        ],
+    ) -> FlagResolutionDetails[Union[dict, list]]:
+        """Resolves the flag value for the provided flag key as a list or dictionary"""
+        return self.__evaluator(cast_object, flag_key, default_value, self.__ld_context)
@@ -0,0 +1,71 @@
+import threading
+from typing import Optional
+
+from ldclient import Config, LDClient
+
+
+class SharedClient:
+    """
+    A LaunchDarkly client shared by several providers, such as providers registered for different OpenFeature
+    domains, so that they use a single connection and feature store.
+
+    The client is created when the first provider acquires it and closed when the last provider releases it by
+    shutting down.
+
+    .. code-block:: python
+
+        shared_client = SharedClient(Config("sdk-key"))
+
+        api.set_provider(LaunchDarklyProvider(shared_client), domain="checkout")
+        api.set_provider(LaunchDarklyProvider(shared_client), domain="search")
+    """
+
+    def __init__(self, config: Config):
+        self.__config = config
+        self.__lock = threading.Lock()
+        self.__client: Optional[LDClient] = None
+        self.__references = 0
+
+    @property
+    def config(self) -> Config:
+        """The configuration the client is created with."""
+        return self.__config
+
+    @property
+    def references(self) -> int:
+        """The number of providers currently holding the client."""
+        with self.__lock:
+            return self.__references
+
+    def acquire(self, start_wait: Optional[float] = None) -> LDClient:
+        """
+        Retrieve the client, creating it if no provider currently holds it.
+
+        :param start_wait: The number of seconds the client constructor waits for initialization when the client
+            is created. Defaults to None, which uses the SDK default.
+        """
+        with self.__lock:
+            if self.__client is None:
+                if start_wait is None:
+                    self.__client = LDClient(self.__config)
+                else:
+                    self.__client = LDClient(self.__config, start_wait=start_wait)
+
+            self.__references += 1
+            return self.__client
+
+    def release(self):
+        """Release a reference to the client, closing it if this was the last one."""
+        with self.__lock:
+            if self.__references == 0:
+                raise RuntimeError("the shared client has not been acquired")
+
+            self.__references -= 1
+            if self.__references > 0:
+                return
+
+            client = self.__client
+            self.__client = None
+
+        if client is not None:
+            client.close()
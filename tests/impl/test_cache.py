@@ -0,0 +1,86 @@
+import pytest
+
+from ld_openfeature.impl.cache import LRUCache
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+def test_hits_and_misses_are_counted():
+    cache: LRUCache[str, int] = LRUCache(2)
+
+    assert cache.get('a') is None
+    cache.put('a', 1)
+    assert cache.get('a') == 1
+
+    stats = cache.stats
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.evictions == 0
+    assert stats.size == 1
+    assert stats.capacity == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+
+    # Touch 'a' so 'b' becomes the least recently used entry.
+    cache.get('a')
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats.evictions == 1
+    assert cache.stats.size == 2
+
+
+def test_clear_removes_entries():
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache.put('a', 1)
+    cache.clear()
+
+    assert cache.get('a') is None
+    assert cache.stats.size == 0
+
+
+def test_hit_rate():
+    cache = LRUCache(2)
+    assert cache.stats.hit_rate == 0.0
+
+    cache.put('a', 1)
+    cache.get('a')
+    cache.get('a')
+    cache.get('a')
+    cache.get('b')
+
+    assert cache.stats.hit_rate == 0.75
+
+
+def test_peek_is_not_counted():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+
+    assert cache.peek('a') == 1
+    assert cache.peek('c') is None
+
+    # Peeking does not make 'a' the most recently used entry.
+    cache.put('c', 3)
+    assert cache.peek('a') is None
+    assert cache.stats.hits == 0
+    assert cache.stats.misses == 0
+
+
+def test_discard_removes_entry():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.discard('a')
+    cache.discard('b')
+
+    assert cache.get('a') is None
+    assert cache.stats.size == 0
@@ -0,0 +1,51 @@
+import threading
+
+import pytest
+
+from ld_openfeature.impl.change_coalescer import FlagChangeCoalescer
+
+
+def test_invalid_settings_are_rejected():
+    with pytest.raises(ValueError):
+        FlagChangeCoalescer(lambda keys: None, 0)
+
+    with pytest.raises(ValueError):
+        FlagChangeCoalescer(lambda keys: None, 1, max_batch_size=0)
+
+
+def test_changes_are_reported_together_after_the_delay():
+    batches = []
+    reported = threading.Event()
+
+    def emit(keys):
+        batches.append(keys)
+        reported.set()
+
+    coalescer = FlagChangeCoalescer(emit, 0.05)
+    for key in ('a', 'b', 'a', 'c'):
+        coalescer.add(key)
+
+    assert batches == []
+    assert reported.wait(timeout=5)
+    assert batches == [['a', 'b', 'c']]
+
+
+def test_full_batches_are_reported_immediately():
+    batches = []
+    coalescer = FlagChangeCoalescer(batches.append, 60, max_batch_size=2)
+
+    for key in ('a', 'b', 'c'):
+        coalescer.add(key)
+
+    assert batches == [['a', 'b']]
+
+    coalescer.flush()
+    assert batches == [['a', 'b'], ['c']]
+
+
+def test_flush_without_changes_reports_nothing():
+    batches = []
+    coalescer = FlagChangeCoalescer(batches.append, 60)
+    coalescer.flush()
+
+    assert batches == []
@@ -0,0 +1,101 @@
+import pytest
+from openfeature.evaluation_context import EvaluationContext
+
+from ld_openfeature.impl.context_cache import CachingEvaluationContextConverter, ContextSnapshot, lookup_key
+from ld_openfeature.impl.context_converter import EvaluationContextConverter
+
+
+@pytest.fixture
+def caching_converter() -> CachingEvaluationContextConverter:
+    return CachingEvaluationContextConverter(EvaluationContextConverter(), 2)
+
+
+def test_repeated_conversions_are_served_from_the_cache(caching_converter: CachingEvaluationContextConverter):
+    first = caching_converter.to_ld_context(EvaluationContext('user-key', {'name': 'Sandy'}))
+    second = caching_converter.to_ld_context(EvaluationContext('user-key', {'name': 'Sandy'}))
+
+    assert first is second
+    assert second.key == 'user-key'
+    assert second.name == 'Sandy'
+    assert caching_converter.stats.hits == 1
+    assert caching_converter.stats.misses == 1
+
+
+def test_distinct_contexts_are_converted_separately(caching_converter: CachingEvaluationContextConverter):
+    user = caching_converter.to_ld_context(EvaluationContext('user-key'))
+    org = caching_converter.to_ld_context(EvaluationContext('org-key', {'kind': 'org'}))
+
+    assert user.kind == 'user'
+    assert org.kind == 'org'
+    assert caching_converter.stats.misses == 2
+
+
+def test_cache_evicts_when_full(caching_converter: CachingEvaluationContextConverter):
+    for key in ('a', 'b', 'c'):
+        caching_converter.to_ld_context(EvaluationContext(key))
+
+    assert caching_converter.stats.size == 2
+    assert caching_converter.stats.evictions == 1
+
+
+def test_lookup_key_uses_the_keys_of_the_context():
+    assert lookup_key(EvaluationContext('user-key', {'name': 'Sandy'})) == 'user-key'
+    assert lookup_key(EvaluationContext(None, {'key': 'user-key'})) == 'user-key'
+    assert lookup_key(EvaluationContext(None, {
+        'kind': 'multi',
+        'user': {'key': 'user-key'},
+        'org': {'key': 'org-key'},
+    })) == ('user-key', 'org-key')
+
+
+def test_snapshot_matches_equal_contexts():
+    snapshot = ContextSnapshot(EvaluationContext('user-key', {'name': 'Sandy', 'groups': ['a'], 'age': 3}))
+
+    assert snapshot.matches(EvaluationContext('user-key', {'name': 'Sandy', 'groups': ['a'], 'age': 3}))
+    assert not snapshot.matches(EvaluationContext('other-key', {'name': 'Sandy', 'groups': ['a'], 'age': 3}))
+    assert not snapshot.matches(EvaluationContext('user-key', {'name': 'Sandy', 'groups': ['b'], 'age': 3}))
+
+
+def test_snapshot_does_not_match_values_of_different_types():
+    snapshot = ContextSnapshot(EvaluationContext('user-key', {'anonymous': True, 'address': {'floor': 1}}))
+
+    assert not snapshot.matches(EvaluationContext('user-key', {'anonymous': 1, 'address': {'floor': 1}}))
+    assert not snapshot.matches(EvaluationContext('user-key', {'anonymous': True, 'address': {'floor': 1.0}}))
+
+
+def test_snapshot_is_not_changed_by_the_context():
+    attributes = {'groups': ['a']}
+    snapshot = ContextSnapshot(EvaluationContext('user-key', attributes))
+
+    attributes['groups'].append('b')
+
+    assert not snapshot.matches(EvaluationContext('user-key', attributes))
+    assert snapshot.matches(EvaluationContext('user-key', {'groups': ['a']}))
+
+
+def test_changed_attributes_are_converted_again(caching_converter: CachingEvaluationContextConverter):
+    caching_converter.to_ld_context(EvaluationContext('user-key', {'name': 'Sandy'}))
+    changed = caching_converter.to_ld_context(EvaluationContext('user-key', {'name': 'Alex'}))
+
+    assert changed.name == 'Alex'
+    assert caching_converter.stats.misses == 2
+    assert caching_converter.stats.size == 1
+
+
+def test_multi_contexts_are_cached(caching_converter: CachingEvaluationContextConverter):
+    def multi_context() -> EvaluationContext:
+        return EvaluationContext(None, {'kind': 'multi', 'user': {'key': 'user-key'}, 'org': {'key': 'org-key'}})
+
+    first = caching_converter.to_ld_context(multi_context())
+    second = caching_converter.to_ld_context(multi_context())
+
+    assert first is second
+    assert second.multiple
+
+
+def test_contexts_with_problems_are_not_cached(caching_converter: CachingEvaluationContextConverter):
+    for _ in range(3):
+        caching_converter.to_ld_context(EvaluationContext('user-key', {'name': 5}))
+        caching_converter.to_ld_context(EvaluationContext(None, {'kind': 'user', 'key': ''}))
+
+    assert caching_converter.stats.size == 0
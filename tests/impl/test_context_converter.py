@@ -1,5 +1,8 @@
+import inspect
 from typing import Mapping
+
 import pytest
+from ldclient.context import Context
 from openfeature.evaluation_context import EvaluationContext, EvaluationContextAttribute
 
 from ld_openfeature.impl.context_converter import EvaluationContextConverter
@@ -132,6 +135,20 @@ def test_invalid_attributes_are_ignored(context_converter: EvaluationContextConv
     assert ld_context.private_attributes == ()
 
 
+def test_unset_and_meta_attributes_are_ignored(context_converter: EvaluationContextConverter):
+    context = EvaluationContext("user-key", {
+        "kind": "user",
+        "email": None,  # type: ignore[dict-item]
+        "_meta": {"privateAttributes": ["a"]},
+        "plan": "gold",
+    })
+    ld_context = context_converter.to_ld_context(context)
+
+    assert ld_context.valid is True
+    assert list(ld_context.custom_attributes) == ['plan']
+    assert ld_context.private_attributes == ()
+
+
 def test_private_attributes_are_processed_correctly(context_converter: EvaluationContextConverter):
     context = EvaluationContext("user-key", {"kind": "user", "address": {"street": "123 Easy St", "city": "Anytown"}, "name": "Sandy", "privateAttributes": ["name", "/address/city"]})
     ld_context = context_converter.to_ld_context(context)
@@ -219,3 +236,180 @@ def test_handles_invalid_nested_contexts(context_converter: EvaluationContextCon
 
     assert ld_context.valid is False
     assert ld_context.multiple is False
+
+
+@pytest.mark.parametrize("validation", ["permissive", "strict", "trusted"])
+def test_valid_attributes_are_converted_in_every_validation_mode(validation: str):
+    context_converter = EvaluationContextConverter(validation=validation)
+    context = EvaluationContext("user-key", {"name": "Sandy", "anonymous": True, "privateAttributes": ["email"],
+                                             "email": "sandy@example.com"})
+
+    for _ in range(2):
+        ld_context = context_converter.to_ld_context(context)
+
+        assert ld_context.valid is True
+        assert ld_context.name == 'Sandy'
+        assert ld_context.anonymous is True
+        assert ld_context.private_attributes == ["email"]
+        assert ld_context.get('email') == 'sandy@example.com'
+
+
+def test_strict_validation_rejects_invalid_contexts(caplog):
+    context_converter = EvaluationContextConverter(validation="strict")
+    valid = context_converter.to_ld_context(EvaluationContext("user-key", {"name": "Sandy", "privateAttributes": ["a"]}))
+
+    ld_context = context_converter.to_ld_context(
+        EvaluationContext("user-key", {"name": 30, "privateAttributes": ["a", 1]}))
+
+    assert valid.valid is True
+    assert ld_context.valid is False
+    assert context_converter.log_counts == {
+        "The attribute 'name' must be a string": 1,
+        "'privateAttributes' must be an array of only string values": 1,
+    }
+    assert [record.message for record in caplog.records] == [
+        "The attribute 'name' must be a string",
+        "'privateAttributes' must be an array of only string values",
+    ]
+
+
+def test_strict_validation_rejects_multi_context_with_invalid_kind():
+    context_converter = EvaluationContextConverter(validation="strict")
+
+    ld_context = context_converter.to_ld_context(EvaluationContext(None, {
+        "kind": "multi",
+        "user": {"key": "user-key"},
+        "org": {"key": "org-key", "anonymous": "yes"},
+    }))
+
+    assert ld_context.valid is False
+
+
+def test_trusted_validation_does_not_check_attributes():
+    context_converter = EvaluationContextConverter(validation="trusted")
+
+    ld_context = context_converter.to_ld_context(EvaluationContext("user-key", {"anonymous": "yes"}))
+
+    assert ld_context.anonymous == "yes"
+    assert context_converter.log_counts == {}
+
+
+def test_multi_context_kind_with_invalid_targeting_key_is_reported(caplog):
+    context = EvaluationContext(None, {
+        "kind": "multi",
+        "user": {"key": "user-key"},
+        "org": {"key": "org-key", "targetingKey": 5},
+    })
+
+    ld_context = EvaluationContextConverter().to_ld_context(context)
+
+    assert ld_context.valid is True
+    assert ld_context.multiple is False
+    assert ld_context.kind == 'user'
+    assert caplog.records[0].message == "A non-string 'targetingKey' attribute was provided for the 'org' kind."
+
+
+def test_strict_validation_rejects_multi_context_with_invalid_targeting_key():
+    context_converter = EvaluationContextConverter(validation="strict")
+
+    ld_context = context_converter.to_ld_context(EvaluationContext(None, {
+        "kind": "multi",
+        "user": {"key": "user-key"},
+        "org": {"key": "org-key", "targetingKey": 5},
+    }))
+
+    assert ld_context.valid is False
+    assert context_converter.log_counts == {
+        "A non-string 'targetingKey' attribute was provided for the 'org' kind.": 1,
+    }
+
+
+def test_unknown_validation_mode_is_rejected():
+    with pytest.raises(ValueError):
+        EvaluationContextConverter(validation="lenient")
+
+
+def test_multi_context_with_one_valid_kind_is_that_kind(context_converter: EvaluationContextConverter):
+    ld_context = context_converter.to_ld_context(
+        EvaluationContext(None, {"kind": "multi", "user": {"key": "user-key"}, "org": "not-a-dict"}))
+
+    assert ld_context.valid is True
+    assert ld_context.multiple is False
+    assert ld_context.key == 'user-key'
+
+
+def test_multi_context_without_valid_kinds_is_invalid(context_converter: EvaluationContextConverter):
+    ld_context = context_converter.to_ld_context(EvaluationContext(None, {"kind": "multi", "org": "not-a-dict"}))
+
+    assert ld_context.valid is False
+
+
+def multi_context(user_key: str, org: dict) -> EvaluationContext:
+    return EvaluationContext(None, {"kind": "multi", "user": {"key": user_key}, "org": org})
+
+
+def test_unchanged_kinds_are_reused():
+    context_converter = EvaluationContextConverter(kind_cache_size=10)
+    org = {"key": "org-key", "name": "LaunchDarkly", "seats": 10}
+
+    first = context_converter.to_ld_context(multi_context("user-1", org))
+    second = context_converter.to_ld_context(multi_context("user-2", org))
+    third = context_converter.to_ld_context(multi_context("user-3", org))
+
+    assert third.get_individual_context('org') is second.get_individual_context('org')
+    assert third.get_individual_context('user').key == 'user-3'
+    assert first == context_converter.to_ld_context(multi_context("user-1", org))
+    assert context_converter.kind_cache_stats is not None
+    assert context_converter.kind_cache_stats.hits == 2
+
+
+def test_changed_kinds_are_converted_again():
+    context_converter = EvaluationContextConverter(kind_cache_size=10)
+    org = {"key": "org-key", "name": "LaunchDarkly", "seats": 10}
+    context_converter.to_ld_context(multi_context("user-1", org))
+    context_converter.to_ld_context(multi_context("user-2", org))
+
+    org["name"] = "Catamorphic"
+    renamed = context_converter.to_ld_context(multi_context("user-3", org))
+    retyped = context_converter.to_ld_context(multi_context("user-4", dict(org, seats=10.0)))
+
+    assert renamed.get_individual_context('org').name == "Catamorphic"
+    assert retyped.get_individual_context('org').get('seats').__class__ is float
+
+
+def test_kinds_with_problems_are_logged_every_time():
+    context_converter = EvaluationContextConverter(kind_cache_size=10)
+    org = {"key": "org-key", "name": 5}
+
+    for index in range(3):
+        context_converter.to_ld_context(multi_context("user-%d" % index, org))
+
+    assert context_converter.log_counts == {"The attribute 'name' must be a string": 3}
+
+
+def test_kind_cache_is_disabled_by_default(context_converter: EvaluationContextConverter):
+    assert context_converter.kind_cache_stats is None
+
+
+def test_context_constructor_signature_is_unchanged():
+    # The converter builds contexts with the Context constructor rather than ContextBuilder, for speed.
+    parameters = list(inspect.signature(Context.__init__).parameters)
+
+    assert parameters[:7] == ['self', 'kind', 'key', 'name', 'anonymous', 'attributes', 'private_attributes']
+    assert 'error' in parameters
+
+
+def test_converted_context_matches_context_builder(context_converter: EvaluationContextConverter):
+    ld_context = context_converter.to_ld_context(EvaluationContext("org-key", {
+        "kind": "org", "name": "LaunchDarkly", "anonymous": True, "privateAttributes": ["region"], "region": "us",
+    }))
+
+    expected = Context.builder("org-key").kind("org").name("LaunchDarkly").anonymous(True) \
+        .private("region").set("region", "us").build()
+    assert ld_context == expected
+    assert ld_context.private_attributes == expected.private_attributes
+
+    error_context = EvaluationContextConverter(validation="strict").to_ld_context(
+        EvaluationContext("org-key", {"kind": "org", "name": 5}))
+    assert error_context.valid is False
+    assert error_context.error == "context has invalid built-in attributes"
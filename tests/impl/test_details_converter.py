@@ -46,3 +46,50 @@ def test_ld_to_openfeature_error_kind_mappings(error_kind: Optional[str], error_
     resolution_details = details_converter.to_resolution_details(detail)
     assert resolution_details.reason == Reason.ERROR
     assert resolution_details.error_code == error_code
+
+
+def test_variant_is_the_variation_index(details_converter: ResolutionDetailsConverter):
+    assert details_converter.to_resolution_details(EvaluationDetail(True, 3, {'kind': 'FALLTHROUGH'})).variant == '3'
+    assert details_converter.to_resolution_details(EvaluationDetail(True, 1000, {'kind': 'FALLTHROUGH'})).variant == '1000'
+    assert details_converter.to_resolution_details(EvaluationDetail(True, None, {'kind': 'FALLTHROUGH'})).variant is None
+
+
+def test_results_are_not_shared_by_default(details_converter: ResolutionDetailsConverter):
+    detail = EvaluationDetail(True, 0, {'kind': 'FALLTHROUGH'})
+
+    first = details_converter.to_resolution_details(detail)
+    second = details_converter.to_resolution_details(detail)
+
+    assert first == second
+    assert first is not second
+
+
+def test_results_for_scalar_values_can_be_shared():
+    details_converter = ResolutionDetailsConverter(reuse_results=True)
+
+    first = details_converter.to_resolution_details(EvaluationDetail(True, 0, {'kind': 'FALLTHROUGH'}))
+    second = details_converter.to_resolution_details(EvaluationDetail(True, 0, {'kind': 'FALLTHROUGH'}))
+
+    assert first is second
+    assert second.value is True
+    assert second.variant == '0'
+
+
+def test_shared_results_distinguish_values_of_different_types():
+    details_converter = ResolutionDetailsConverter(reuse_results=True)
+
+    as_bool = details_converter.to_resolution_details(EvaluationDetail(True, 0, {'kind': 'FALLTHROUGH'}))
+    as_int = details_converter.to_resolution_details(EvaluationDetail(1, 0, {'kind': 'FALLTHROUGH'}))
+
+    assert as_bool.value is True
+    assert type(as_int.value) is int
+
+
+def test_results_for_object_values_are_never_shared():
+    details_converter = ResolutionDetailsConverter(reuse_results=True)
+    detail = EvaluationDetail({'key': 'value'}, 0, {'kind': 'FALLTHROUGH'})
+
+    first = details_converter.to_resolution_details(detail)
+    second = details_converter.to_resolution_details(detail)
+
+    assert first is not second
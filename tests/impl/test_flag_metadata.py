@@ -0,0 +1,96 @@
+from ldclient.integrations.test_data import TestData
+
+from ld_openfeature.impl.flag_metadata import EMPTY_METADATA, FlagMetadata, FlagMetadataCache
+
+
+def build_flag(version: int = 1):
+    flag = TestData().data_source().flag("flag-key").variations(False, True).fallthrough_variation(0) \
+        .if_match('key', 'user-key').then_return(1)
+    return flag._build(version)
+
+
+def test_metadata_is_hashable_and_comparable():
+    first = FlagMetadata({'version': 1, 'trackEvents': False})
+    second = FlagMetadata({'trackEvents': False, 'version': 1})
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert dict(first) == {'version': 1, 'trackEvents': False}
+    assert first != FlagMetadata({'version': 2, 'trackEvents': False})
+
+
+def test_metadata_for_fallthrough():
+    cache = FlagMetadataCache(lambda key: build_flag(3))
+
+    metadata = cache.get("flag-key", {'kind': 'FALLTHROUGH'})
+
+    assert dict(metadata) == {'version': 3, 'trackEvents': False}
+
+
+def test_metadata_for_rule_match_includes_rule():
+    flag = build_flag()
+    rule_id = flag['rules'][0]['id']
+    cache = FlagMetadataCache(lambda key: flag)
+
+    metadata = cache.get("flag-key", {'kind': 'RULE_MATCH', 'ruleIndex': 0, 'ruleId': rule_id, 'inExperiment': True})
+
+    assert metadata['ruleIndex'] == 0
+    assert metadata['ruleId'] == rule_id
+    assert metadata['inExperiment'] is True
+
+
+def test_missing_flags_have_empty_metadata():
+    cache = FlagMetadataCache(lambda key: None)
+
+    assert cache.get("flag-key", {'kind': 'ERROR', 'errorKind': 'FLAG_NOT_FOUND'}) is EMPTY_METADATA
+
+
+def test_metadata_is_reused_until_invalidated():
+    lookups = []
+    version = 1
+
+    def get_flag(key: str):
+        lookups.append(key)
+        return build_flag(version)
+
+    cache = FlagMetadataCache(get_flag)
+
+    first = cache.get("flag-key", {'kind': 'FALLTHROUGH'})
+    second = cache.get("flag-key", {'kind': 'FALLTHROUGH'})
+    assert first is second
+    assert len(lookups) == 1
+
+    version = 2
+    cache.invalidate("flag-key")
+
+    assert cache.get("flag-key", {'kind': 'FALLTHROUGH'})['version'] == 2
+    assert len(lookups) == 2
+
+
+def test_metadata_read_before_a_change_is_not_cached():
+    versions = [1, 2]
+    cache: FlagMetadataCache
+
+    def get_flag(key: str):
+        flag = build_flag(versions[0])
+        if versions[0] == 1:
+            # The flag changes after it has been read, but before its metadata is stored.
+            versions.pop(0)
+            cache.invalidate(key)
+        return flag
+
+    cache = FlagMetadataCache(get_flag)
+
+    assert cache.get("flag-key", {'kind': 'FALLTHROUGH'})['version'] == 1
+    assert cache.get("flag-key", {'kind': 'FALLTHROUGH'})['version'] == 2
+
+
+def test_checked_versions_replace_metadata_without_invalidation():
+    version = 1
+    cache = FlagMetadataCache(lambda key: build_flag(version), check_versions=True)
+
+    first = cache.get("flag-key", {'kind': 'FALLTHROUGH'})
+    assert cache.get("flag-key", {'kind': 'FALLTHROUGH'}) is first
+
+    version = 2
+    assert cache.get("flag-key", {'kind': 'FALLTHROUGH'})['version'] == 2
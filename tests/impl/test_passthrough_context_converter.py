@@ -0,0 +1,31 @@
+from ldclient import Context
+from openfeature.evaluation_context import EvaluationContext
+
+from ld_openfeature.context import LD_CONTEXT_ATTRIBUTE, from_ld_context
+from ld_openfeature.impl.context_converter import EvaluationContextConverter
+from ld_openfeature.impl.passthrough_context_converter import PassthroughContextConverter
+
+
+def test_carried_context_is_returned_unchanged():
+    converter = PassthroughContextConverter(EvaluationContextConverter())
+    ld_context = Context.builder('user-key').name('Sandy').build()
+
+    assert converter.to_ld_context(from_ld_context(ld_context)) is ld_context
+
+
+def test_carried_context_survives_merging():
+    converter = PassthroughContextConverter(EvaluationContextConverter())
+    ld_context = Context.create_multi(Context.create('user-key'), Context.create('org-key', 'org'))
+
+    merged = EvaluationContext('other-key', {'plan': 'gold'}).merge(from_ld_context(ld_context))
+
+    assert converter.to_ld_context(merged) is ld_context
+
+
+def test_other_contexts_are_converted():
+    converter = PassthroughContextConverter(EvaluationContextConverter())
+
+    ld_context = converter.to_ld_context(EvaluationContext('user-key', {LD_CONTEXT_ATTRIBUTE: 'not-a-context'}))
+
+    assert ld_context.key == 'user-key'
+    assert ld_context.get(LD_CONTEXT_ATTRIBUTE) == 'not-a-context'
@@ -0,0 +1,94 @@
+import logging
+import time
+
+from ld_openfeature.impl.rate_limited_log import RateLimitedLogger
+
+logger = logging.getLogger("test-rate-limited-log")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_repeats_within_interval_are_suppressed(caplog):
+    clock = FakeClock()
+    log = RateLimitedLogger(logger, 60, clock)
+
+    log.warning("bad context")
+    log.warning("bad context")
+    log.error("other problem")
+    log.warning("bad context")
+
+    assert [record.message for record in caplog.records] == ["bad context", "other problem"]
+    assert log.counts == {"bad context": 3, "other problem": 1}
+
+
+def test_suppressed_repeats_are_reported_after_interval(caplog):
+    clock = FakeClock()
+    log = RateLimitedLogger(logger, 60, clock)
+
+    log.error("bad context")
+    log.error("bad context")
+    log.error("bad context")
+    clock.now = 61
+    log.error("bad context")
+    log.error("bad context")
+
+    assert [record.message for record in caplog.records] == [
+        "bad context",
+        "bad context (suppressed 2 repeats of this message)",
+    ]
+    assert caplog.records[1].levelno == logging.ERROR
+    assert log.counts == {"bad context": 5}
+
+
+def test_zero_interval_logs_every_message(caplog):
+    log = RateLimitedLogger(logger, 0, FakeClock())
+
+    log.warning("bad context")
+    log.warning("bad context")
+
+    assert len(caplog.records) == 2
+    assert log.counts == {"bad context": 2}
+
+
+def test_suppressed_repeats_are_reported_when_message_stops_recurring(caplog):
+    log = RateLimitedLogger(logger, 0.05)
+
+    log.warning("bad context")
+    log.warning("bad context")
+    log.warning("bad context")
+
+    deadline = time.monotonic() + 1
+    while len(caplog.records) < 2:
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+    assert [record.message for record in caplog.records] == [
+        "bad context",
+        "bad context (suppressed 2 repeats of this message)",
+    ]
+    assert caplog.records[1].levelno == logging.WARNING
+    log.close()
+
+
+def test_close_reports_pending_repeats(caplog):
+    clock = FakeClock()
+    log = RateLimitedLogger(logger, 60, clock)
+
+    log.error("bad context")
+    log.error("bad context")
+    log.warning("other problem")
+    log.close()
+    log.close()
+
+    assert [record.message for record in caplog.records] == [
+        "bad context",
+        "other problem",
+        "bad context (suppressed 1 repeats of this message)",
+    ]
+    assert log.counts == {"bad context": 2, "other problem": 1}
@@ -0,0 +1,72 @@
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.flag_evaluation import FlagResolutionDetails, FlagType
+
+from ld_openfeature.impl.result_cache import EvaluationResultCache, result_key
+
+CONTEXT = EvaluationContext('user-key', {'group': 'a'})
+
+
+def test_result_key_distinguishes_defaults_and_types():
+    context = EvaluationContext('user-key', {'group': 'a'})
+
+    key = result_key("flag-key", FlagType.BOOLEAN, False, context)
+
+    assert key == result_key("flag-key", FlagType.BOOLEAN, False, EvaluationContext('user-key', {'group': 'a'}))
+    assert key != result_key("flag-key", FlagType.BOOLEAN, True, context)
+    assert key != result_key("flag-key", FlagType.INTEGER, 0, context)
+    assert key != result_key("other-key", FlagType.BOOLEAN, False, context)
+
+
+def test_result_key_supports_object_defaults():
+    context = EvaluationContext('user-key')
+
+    assert result_key("flag-key", FlagType.OBJECT, {'a': [1]}, context) is not None
+
+
+def test_result_key_is_none_for_unhashable_values():
+    multi_context = EvaluationContext(None, {'kind': 'multi', 'user': {'key': ['user-key']}})
+
+    assert result_key("flag-key", FlagType.BOOLEAN, False, multi_context) is None
+    assert result_key("flag-key", FlagType.OBJECT, {'set': {1}}, EvaluationContext('user-key')) is None
+
+
+def test_cached_details_are_returned():
+    cache = EvaluationResultCache(10)
+    details = FlagResolutionDetails(value=True)
+
+    cache.put("key", cache.generation("flag-key"), CONTEXT, details)
+
+    assert cache.get("flag-key", "key", EvaluationContext('user-key', {'group': 'a'})) is details
+    assert cache.stats.hits == 1
+
+
+def test_details_for_a_different_context_are_not_returned():
+    cache = EvaluationResultCache(10)
+    cache.put("key", cache.generation("flag-key"), CONTEXT, FlagResolutionDetails(value=True))
+
+    assert cache.get("flag-key", "key", EvaluationContext('user-key', {'group': 'b'})) is None
+    assert cache.stats.misses == 1
+
+
+def test_invalidation_discards_entries_for_flag():
+    cache = EvaluationResultCache(10)
+    cache.put("key", cache.generation("flag-key"), CONTEXT, FlagResolutionDetails(value=True))
+    other = FlagResolutionDetails(value=False)
+    cache.put("other", cache.generation("other-flag"), CONTEXT, other)
+
+    cache.invalidate("flag-key")
+
+    assert cache.get("flag-key", "key", CONTEXT) is None
+    assert cache.get("other-flag", "other", CONTEXT) is other
+    assert cache.stats.size == 1
+
+
+def test_result_of_evaluation_overlapping_invalidation_is_not_returned():
+    cache = EvaluationResultCache(10)
+    generation = cache.generation("flag-key")
+
+    cache.invalidate("flag-key")
+    cache.put("key", generation, CONTEXT, FlagResolutionDetails(value=True))
+
+    assert cache.get("flag-key", "key", CONTEXT) is None
+    assert cache.stats.misses == 1
@@ -0,0 +1,96 @@
+import json
+import os
+import stat
+
+from ldclient import Config, Context, LDClient
+from ldclient.feature_store import InMemoryFeatureStore
+from ldclient.integrations import Files
+from ldclient.integrations.test_data import TestData
+from ldclient.versioned_data_kind import FEATURES, SEGMENTS
+
+from ld_openfeature.impl.snapshot import load_snapshot, write_snapshot
+
+
+def test_snapshot_contains_flags_and_segments(tmp_path):
+    td = TestData.data_source()
+    td.update(td.flag("flag-key").variations("a", "b").variation_for_all(1))
+    store = InMemoryFeatureStore()
+    client = LDClient(Config("sdk-key", update_processor_class=td, feature_store=store, send_events=False))
+    store.upsert(SEGMENTS, {'key': 'segment-key', 'version': 1, 'included': ['user-key']})
+
+    path = str(tmp_path / "snapshot.json")
+    write_snapshot(store, path)
+    client.close()
+
+    with open(path) as f:
+        data = json.load(f)
+
+    assert data['flags']['flag-key']['variations'] == ["a", "b"]
+    assert data['segments']['segment-key']['included'] == ['user-key']
+
+
+def test_snapshot_can_back_a_file_data_source(tmp_path):
+    store = InMemoryFeatureStore()
+    store.init({FEATURES: {}, SEGMENTS: {}})
+    store.upsert(FEATURES, TestData().data_source().flag("flag-key").variations("a", "b").variation_for_all(1)._build(3))
+
+    path = str(tmp_path / "snapshot.json")
+    write_snapshot(store, path)
+
+    client = LDClient(Config("sdk-key", update_processor_class=Files.new_data_source(paths=[path]), send_events=False))
+    assert client.variation("flag-key", Context.create("user-key"), "default") == "b"
+    client.close()
+
+
+def test_snapshot_is_loaded_into_an_uninitialized_store(tmp_path):
+    source = InMemoryFeatureStore()
+    source.init({FEATURES: {}, SEGMENTS: {}})
+    source.upsert(FEATURES, TestData().data_source().flag("flag-key").variation_for_all(True)._build(1))
+
+    path = str(tmp_path / "snapshot.json")
+    write_snapshot(source, path)
+
+    store = InMemoryFeatureStore()
+    assert load_snapshot(store, path) is True
+    assert store.initialized
+    assert store.get(FEATURES, "flag-key", lambda flag: flag)['key'] == "flag-key"
+
+
+def test_snapshot_is_not_loaded_into_an_initialized_store(tmp_path):
+    path = tmp_path / "snapshot.json"
+    path.write_text('{"flags": {}, "segments": {}}')
+
+    store = InMemoryFeatureStore()
+    store.init({FEATURES: {}, SEGMENTS: {}})
+
+    assert load_snapshot(store, str(path)) is False
+
+
+def test_missing_snapshot_is_ignored(tmp_path):
+    store = InMemoryFeatureStore()
+
+    assert load_snapshot(store, str(tmp_path / "missing.json")) is False
+    assert not store.initialized
+
+
+def test_malformed_snapshot_is_ignored(tmp_path, caplog):
+    path = tmp_path / "snapshot.json"
+    path.write_text('{"flags": ')
+    store = InMemoryFeatureStore()
+
+    assert load_snapshot(store, str(path)) is False
+    assert not store.initialized
+    assert caplog.records[0].message.startswith("Unable to read flag snapshot")
+
+
+def test_snapshot_is_only_readable_by_its_owner(tmp_path):
+    store = InMemoryFeatureStore()
+    store.init({FEATURES: {}, SEGMENTS: {'segment-key': {'key': 'segment-key', 'version': 1, 'included': ['user-key']}}})
+
+    path = tmp_path / "snapshot.json"
+    path.write_text("{}")
+    path.chmod(0o644)
+    write_snapshot(store, str(path))
+
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    assert os.listdir(tmp_path) == ["snapshot.json"]
@@ -0,0 +1,27 @@
+import pytest
+from openfeature.flag_evaluation import FlagType
+
+from ld_openfeature.impl.value_types import cast_for
+
+
+@pytest.mark.parametrize("flag_type, value, expected", [
+    (FlagType.BOOLEAN, True, True),
+    (FlagType.BOOLEAN, 1, None),
+    (FlagType.STRING, 'value', 'value'),
+    (FlagType.STRING, 1, None),
+    (FlagType.INTEGER, 3.7, 3),
+    (FlagType.INTEGER, True, None),
+    (FlagType.FLOAT, 3, 3.0),
+    (FlagType.FLOAT, False, None),
+    (FlagType.OBJECT, [1], [1]),
+    (FlagType.OBJECT, 'value', None),
+])
+def test_values_are_cast_to_flag_type(flag_type: FlagType, value, expected):
+    result = cast_for(flag_type)(value)
+
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+def test_unknown_flag_type_is_a_mismatch():
+    assert cast_for('UNKNOWN')(True) is None  # type: ignore[arg-type]
@@ -74,6 +74,60 @@ class DelayedFailingDataSource(UpdateProcessor):
         return False
 
 
+class DelayedValidDataSource(UpdateProcessor):
+    def __init__(self, config: Config, store, ready: threading.Event):
+        self._data_source_update_sink: Optional[DataSourceUpdateSink] = config.data_source_update_sink
+        self._ready = ready
+        self._initialized = False
+
+    def start(self):
+        # Release the client constructor immediately so that the provider is left to wait for initialization.
+        self._ready.set()
+
+        def data_source_valid():
+            self._initialized = True
+            self._data_source_update_sink.init({})
+            self._data_source_update_sink.update_status(DataSourceState.VALID, None)
+
+        threading.Timer(0.1, data_source_valid).start()
+
+    def stop(self):
+        pass
+
+    def is_alive(self):
+        return False
+
+    def initialized(self):
+        return self._initialized
+
+
+class LateReleasingDataSource(UpdateProcessor):
+    """Releases the client constructor only once it has initialized, as the streaming data source does."""
+
+    def __init__(self, config: Config, store, ready: threading.Event):
+        self._data_source_update_sink: Optional[DataSourceUpdateSink] = config.data_source_update_sink
+        self._ready = ready
+        self._initialized = False
+
+    def start(self):
+        def data_source_valid():
+            self._initialized = True
+            self._data_source_update_sink.init({})
+            self._data_source_update_sink.update_status(DataSourceState.VALID, None)
+            self._ready.set()
+
+        threading.Timer(0.5, data_source_valid).start()
+
+    def stop(self):
+        pass
+
+    def is_alive(self):
+        return False
+
+    def initialized(self):
+        return self._initialized
+
+
 class StaleDataSource(UpdateProcessor):
     def __init__(self, config: Config, store, ready: threading.Event):
         self._data_source_update_sink: Optional[DataSourceUpdateSink] = config.data_source_update_sink
@@ -132,3 +186,51 @@ class UpdatingDataSource(UpdateProcessor):
 
     def initialized(self):
         return True
+
+
+class EmptyDataSource(UpdateProcessor):
+    """Initializes with no flags, leaving tests to write flags through the config's data source update sink."""
+
+    def __init__(self, config: Config, store, ready: threading.Event):
+        self._data_source_update_sink: Optional[DataSourceUpdateSink] = config.data_source_update_sink
+        self._ready = ready
+
+    def start(self):
+        self._data_source_update_sink.init({})
+        self._data_source_update_sink.update_status(DataSourceState.VALID, None)
+        self._ready.set()
+
+    def stop(self):
+        pass
+
+    def is_alive(self):
+        return False
+
+    def initialized(self):
+        return True
+
+
+class MultiUpdatingDataSource(UpdateProcessor):
+    def __init__(self, config: Config, store, ready: threading.Event):
+        self._data_source_update_sink: Optional[DataSourceUpdateSink] = config.data_source_update_sink
+        self._ready = ready
+
+    def start(self):
+        self._ready.set()
+        self._data_source_update_sink.init({})
+        self._data_source_update_sink.update_status(DataSourceState.VALID, None)
+
+        def update_data():
+            for key in ("flag-a", "flag-b", "flag-c"):
+                self._data_source_update_sink.upsert(FEATURES, TestData().data_source().flag(key).on(True)._build(1))
+
+        threading.Timer(0.1, update_data).start()
+
+    def stop(self):
+        pass
+
+    def is_alive(self):
+        return False
+
+    def initialized(self):
+        return True
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+import ld_openfeature
+
+# Generous, as the measurement includes any stdlib modules which are not already loaded. Importing the package
+# eagerly, including the LaunchDarkly and OpenFeature SDKs, takes well over this on typical hardware.
+MAX_IMPORT_MICROSECONDS = 50_000
+
+
+def import_times(statement: str) -> Dict[str, int]:
+    """Run the statement in a fresh interpreter, returning the cumulative import time of each module."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            capture_output=True, text=True, check=True)
+
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def test_importing_package_does_not_import_sdks():
+    times = import_times('import ld_openfeature')
+
+    assert 'ld_openfeature' in times
+    assert not [name for name in times if name.split('.')[0] in ('ldclient', 'openfeature')]
+    assert times['ld_openfeature'] < MAX_IMPORT_MICROSECONDS
+
+
+def test_exports_are_loaded_on_access():
+    times = import_times('from ld_openfeature import LaunchDarklyProvider')
+
+    assert 'ld_openfeature.provider' in times
+    assert 'ldclient' in times
+
+
+def test_all_exports_resolve():
+    for name in ld_openfeature.__all__:
+        assert getattr(ld_openfeature, name) is not None
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        ld_openfeature.NotAnExport  # type: ignore[attr-defined]
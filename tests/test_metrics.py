@@ -0,0 +1,46 @@
+from openfeature.exception import ErrorCode
+
+from ld_openfeature.metrics import InMemoryMetricsSink, PHASE_CONTEXT_CONVERSION, PHASE_DETAILS_CONVERSION, \
+    PHASE_SDK_EVALUATION, to_prometheus_text
+
+
+def test_evaluations_are_counted_per_flag():
+    sink = InMemoryMetricsSink()
+    sink.record_evaluation('flag-a', None, 0.0001, 0.00001)
+    sink.record_evaluation('flag-a', None, 0.0001, 0.00001)
+    sink.record_evaluation('flag-b', ErrorCode.FLAG_NOT_FOUND, 0.0001, 0.00001)
+
+    assert sink.evaluation_counts == {'flag-a': 2, 'flag-b': 1}
+    assert sink.error_counts == {ErrorCode.FLAG_NOT_FOUND: 1}
+
+
+def test_durations_are_bucketed_per_phase():
+    sink = InMemoryMetricsSink(buckets=(0.001, 0.01))
+    sink.record_context_conversion(0.0005)
+    sink.record_evaluation('flag-a', None, 0.005, 0.5)
+
+    conversion = sink.histogram(PHASE_CONTEXT_CONVERSION)
+    assert conversion.buckets == (0.001, 0.01)
+    assert conversion.counts == [1, 0, 0]
+    assert conversion.count == 1
+    assert conversion.sum == 0.0005
+
+    assert sink.histogram(PHASE_SDK_EVALUATION).counts == [0, 1, 0]
+    assert sink.histogram(PHASE_DETAILS_CONVERSION).counts == [0, 0, 1]
+
+
+def test_prometheus_text_export():
+    sink = InMemoryMetricsSink(buckets=(0.001, 0.01))
+    sink.record_context_conversion(0.0005)
+    sink.record_evaluation('flag-"a"', ErrorCode.TYPE_MISMATCH, 0.005, 0.0005)
+
+    lines = to_prometheus_text(sink).splitlines()
+
+    assert '# TYPE launchdarkly_openfeature_evaluations_total counter' in lines
+    assert 'launchdarkly_openfeature_evaluations_total{flag_key="flag-\\"a\\""} 1' in lines
+    assert 'launchdarkly_openfeature_evaluation_errors_total{error_code="TYPE_MISMATCH"} 1' in lines
+    assert '# TYPE launchdarkly_openfeature_phase_duration_seconds histogram' in lines
+    assert 'launchdarkly_openfeature_phase_duration_seconds_bucket{phase="sdk_evaluation",le="0.001"} 0' in lines
+    assert 'launchdarkly_openfeature_phase_duration_seconds_bucket{phase="sdk_evaluation",le="0.01"} 1' in lines
+    assert 'launchdarkly_openfeature_phase_duration_seconds_bucket{phase="sdk_evaluation",le="+Inf"} 1' in lines
+    assert 'launchdarkly_openfeature_phase_duration_seconds_count{phase="context_conversion"} 1' in lines
@@ -1,19 +1,28 @@
+import asyncio
+import json
 import threading
-from typing import List, Union
+import time
+from typing import List, Tuple, Union
 from unittest.mock import patch
 
 import pytest
-from ldclient import LDClient
+from ldclient import Context, LDClient
 from ldclient.evaluation import EvaluationDetail
+from ldclient.feature_store import InMemoryFeatureStore
 from ldclient.integrations.test_data import TestData
+from ldclient.versioned_data_kind import FEATURES, SEGMENTS
 from openfeature.evaluation_context import EvaluationContext
-from openfeature.event import ProviderEvent, EventDetails
-from openfeature.exception import ErrorCode
-from openfeature.flag_evaluation import Reason
+from openfeature.event import ProviderEvent, EventDetails, ProviderEventDetails
+from openfeature.exception import ErrorCode, ProviderFatalError, ProviderNotReadyError
+from openfeature.flag_evaluation import FlagType, Reason
 from openfeature import api
 
-from ld_openfeature import LaunchDarklyProvider, Config
-from tests.test_data_sources import FailingDataSource, StaleDataSource, UpdatingDataSource, DelayedFailingDataSource
+from ld_openfeature import LaunchDarklyProvider, Config, SharedClient, from_ld_context
+from ld_openfeature.impl.context_converter import EvaluationContextConverter
+from ld_openfeature.metrics import InMemoryMetricsSink, PHASE_CONTEXT_CONVERSION, PHASE_SDK_EVALUATION
+from ld_openfeature.provider import _worker_process_context
+from tests.test_data_sources import FailingDataSource, StaleDataSource, UpdatingDataSource, DelayedFailingDataSource, \
+    DelayedValidDataSource, EmptyDataSource, LateReleasingDataSource, MultiUpdatingDataSource
 
 
 @pytest.fixture
@@ -46,6 +55,299 @@ def test_ldclient_is_accessible(provider: LaunchDarklyProvider):
     assert type(provider.client) is LDClient
 
 
+def test_context_cache_is_disabled_by_default(provider: LaunchDarklyProvider):
+    assert provider.context_cache_stats is None
+
+
+def test_context_cache_reuses_converted_contexts(config: Config, evaluation_context: EvaluationContext):
+    provider = LaunchDarklyProvider(config, context_cache_size=10)
+
+    for _ in range(3):
+        resolution_details = provider.resolve_boolean_details("fallthrough-boolean", False, evaluation_context)
+        assert resolution_details.value is True
+
+    stats = provider.context_cache_stats
+    assert stats is not None
+    assert stats.misses == 1
+    assert stats.hits == 2
+    assert stats.capacity == 10
+
+
+def test_context_kind_cache_reuses_unchanged_kinds(config: Config):
+    provider = LaunchDarklyProvider(config, context_kind_cache_size=10)
+    assert LaunchDarklyProvider(config).context_kind_cache_stats is None
+
+    for index in range(3):
+        context = EvaluationContext(None, {'kind': 'multi', 'user': {'key': 'user-%d' % index},
+                                           'org': {'key': 'org-key', 'name': 'LaunchDarkly'}})
+        resolution_details = provider.resolve_boolean_details("fallthrough-boolean", False, context)
+        assert resolution_details.value is True
+
+    stats = provider.context_kind_cache_stats
+    assert stats is not None
+    assert stats.hits == 1
+    assert stats.capacity == 10
+
+
+def test_resolution_details_can_be_reused(config: Config, evaluation_context: EvaluationContext):
+    provider = LaunchDarklyProvider(config, reuse_resolution_details=True)
+
+    first = provider.resolve_boolean_details("fallthrough-boolean", False, evaluation_context)
+    second = provider.resolve_boolean_details("fallthrough-boolean", False, evaluation_context)
+
+    assert first is second
+    assert second.value is True
+
+
+def test_evaluations_are_reported_to_metrics_sink(config: Config, evaluation_context: EvaluationContext):
+    sink = InMemoryMetricsSink()
+    provider = LaunchDarklyProvider(config, metrics_sink=sink)
+
+    provider.resolve_boolean_details("fallthrough-boolean", False, evaluation_context)
+    provider.resolve_string_details("fallthrough-boolean", "default", evaluation_context)
+    provider.resolve_many([("fallthrough-boolean", FlagType.BOOLEAN, False),
+                           ("missing-flag", FlagType.BOOLEAN, False)], evaluation_context)
+
+    assert sink.evaluation_counts == {"fallthrough-boolean": 3, "missing-flag": 1}
+    assert sink.error_counts == {ErrorCode.TYPE_MISMATCH: 1, ErrorCode.FLAG_NOT_FOUND: 1}
+    assert sink.histogram(PHASE_CONTEXT_CONVERSION).count == 3
+    assert sink.histogram(PHASE_SDK_EVALUATION).count == 4
+
+
+def test_cached_results_are_reported_to_metrics_sink(config: Config, evaluation_context: EvaluationContext):
+    sink = InMemoryMetricsSink()
+    provider = LaunchDarklyProvider(config, metrics_sink=sink, result_cache_size=10)
+
+    for _ in range(5):
+        provider.resolve_boolean_details("fallthrough-boolean", False, evaluation_context)
+
+    stats = provider.result_cache_stats
+    assert stats is not None
+    assert stats.hits == 4
+    assert sink.evaluation_counts == {"fallthrough-boolean": 5}
+    assert sink.histogram(PHASE_CONTEXT_CONVERSION).count == 1
+    assert sink.histogram(PHASE_SDK_EVALUATION).count == 5
+
+
+def test_flag_metadata_is_empty_by_default(provider: LaunchDarklyProvider, evaluation_context: EvaluationContext):
+    resolution_details = provider.resolve_boolean_details("fallthrough-boolean", False, evaluation_context)
+
+    assert resolution_details.flag_metadata == {}
+
+
+def test_flag_metadata_can_be_included(config: Config, evaluation_context: EvaluationContext):
+    provider = LaunchDarklyProvider(config, include_flag_metadata=True)
+
+    first = provider.resolve_boolean_details("fallthrough-boolean", False, evaluation_context)
+    second = provider.resolve_boolean_details("fallthrough-boolean", False, evaluation_context)
+
+    assert dict(first.flag_metadata) == {'version': 1, 'trackEvents': False}
+    assert first.flag_metadata is second.flag_metadata
+
+    missing = provider.resolve_boolean_details("missing-flag", False, evaluation_context)
+    assert missing.flag_metadata == {}
+
+
+def test_result_cache_is_disabled_by_default(provider: LaunchDarklyProvider):
+    assert provider.result_cache_stats is None
+
+
+def test_result_cache_serves_repeated_evaluations(config: Config, evaluation_context: EvaluationContext):
+    provider = LaunchDarklyProvider(config, result_cache_size=10)
+
+    first = provider.resolve_boolean_details("fallthrough-boolean", False, evaluation_context)
+    second = provider.resolve_boolean_details("fallthrough-boolean", False, EvaluationContext('user-key'))
+    other = provider.resolve_boolean_details("fallthrough-boolean", False, EvaluationContext('other-key'))
+
+    assert first.value is True
+    assert second is first
+    assert other is not first
+
+    stats = provider.result_cache_stats
+    assert stats is not None
+    assert stats.hits == 1
+    assert stats.misses == 2
+
+
+def test_result_cache_does_not_cache_errors(config: Config, evaluation_context: EvaluationContext):
+    provider = LaunchDarklyProvider(config, result_cache_size=10)
+
+    provider.resolve_boolean_details("missing-flag", False, evaluation_context)
+    provider.resolve_boolean_details("missing-flag", False, evaluation_context)
+
+    stats = provider.result_cache_stats
+    assert stats is not None
+    assert stats.hits == 0
+    assert stats.size == 0
+
+
+def test_flag_changes_evict_cached_results_and_metadata(evaluation_context: EvaluationContext):
+    config = Config("", update_processor_class=EmptyDataSource, send_events=False)
+    provider = LaunchDarklyProvider(config, result_cache_size=10, include_flag_metadata=True)
+    provider.initialize(evaluation_context)
+
+    # Unlike TestData updates, changes written through the update sink are reported by the flag tracker.
+    sink = config.data_source_update_sink
+    assert sink is not None
+    td = TestData.data_source()
+    sink.upsert(FEATURES, td.flag("changing-flag").variation_for_all(True)._build(1))
+
+    first = provider.resolve_boolean_details("changing-flag", False, evaluation_context)
+    assert provider.resolve_boolean_details("changing-flag", False, evaluation_context) is first
+    assert first.flag_metadata['version'] == 1
+
+    sink.upsert(FEATURES, td.flag("changing-flag").variation_for_all(False)._build(2))
+
+    changed = provider.resolve_boolean_details("changing-flag", True, evaluation_context)
+    assert changed.value is False
+    assert changed.flag_metadata['version'] == 2
+    changed = provider.resolve_boolean_details("changing-flag", False, evaluation_context)
+    assert changed.value is False
+    assert changed.flag_metadata['version'] == 2
+
+    provider.shutdown()
+
+
+def test_result_cache_is_disabled_when_events_are_sent(test_data_source: TestData):
+    provider = LaunchDarklyProvider(Config("example-key", update_processor_class=test_data_source,
+                                           events_uri="http://localhost:0"), result_cache_size=10)
+
+    assert provider.result_cache_stats is None
+    provider.shutdown()
+
+
+def test_result_cache_is_disabled_with_daemon_mode(caplog):
+    store = InMemoryFeatureStore()
+    store.init({FEATURES: {}, SEGMENTS: {}})
+    provider = LaunchDarklyProvider(Config("example-key", feature_store=store, use_ldd=True, send_events=False),
+                                    result_cache_size=10)
+
+    assert provider.result_cache_stats is None
+    assert any("use_ldd" in record.message for record in caplog.records)
+    provider.shutdown()
+
+
+def test_flag_metadata_follows_store_changes_with_daemon_mode(evaluation_context: EvaluationContext):
+    td = TestData.data_source()
+    store = InMemoryFeatureStore()
+    store.init({FEATURES: {"daemon-flag": td.flag("daemon-flag").variation_for_all(True)._build(1)}, SEGMENTS: {}})
+    provider = LaunchDarklyProvider(Config("example-key", feature_store=store, use_ldd=True, send_events=False),
+                                    include_flag_metadata=True)
+
+    assert provider.resolve_boolean_details("daemon-flag", False, evaluation_context).flag_metadata['version'] == 1
+
+    # Written as the Relay Proxy would, without the provider being told of the change.
+    store.upsert(FEATURES, td.flag("daemon-flag").variation_for_all(False)._build(2))
+
+    details = provider.resolve_boolean_details("daemon-flag", True, evaluation_context)
+    assert details.value is False
+    assert details.flag_metadata['version'] == 2
+    provider.shutdown()
+
+
+def test_invalid_context_messages_are_rate_limited(config: Config, caplog):
+    provider = LaunchDarklyProvider(config)
+    context = EvaluationContext(None, {'kind': 'user'})
+
+    for _ in range(3):
+        provider.resolve_boolean_details("fallthrough-boolean", False, context)
+
+    message = "The EvaluationContext must contain either a 'targetingKey' or a 'key' and the type must be a string."
+    assert [record.message for record in caplog.records].count(message) == 1
+    assert provider.context_conversion_log_counts == {message: 3}
+
+    # Repeats still suppressed when the provider shuts down are reported.
+    provider.shutdown()
+    assert caplog.records[-1].message == "%s (suppressed 2 repeats of this message)" % message
+
+
+def test_invalid_contexts_are_counted_with_context_cache(config: Config):
+    provider = LaunchDarklyProvider(config, context_cache_size=10)
+    context = EvaluationContext(None, {'kind': 'user', 'key': ''})
+
+    for _ in range(3):
+        provider.resolve_boolean_details("fallthrough-boolean", False, context)
+
+    message = "The EvaluationContext must contain either a 'targetingKey' or a 'key' and the type must be a string."
+    assert provider.context_conversion_log_counts == {message: 3}
+    provider.shutdown()
+
+
+def test_prebuilt_ld_context_is_evaluated_without_conversion(provider: LaunchDarklyProvider):
+    ld_context = Context.create('user-key')
+
+    with patch.object(EvaluationContextConverter, 'to_ld_context') as to_ld_context:
+        resolution_details = provider.resolve_boolean_details("fallthrough-boolean", False,
+                                                              from_ld_context(ld_context))
+
+    to_ld_context.assert_not_called()
+    assert resolution_details.value is True
+
+
+def test_providers_share_a_client(config: Config, evaluation_context: EvaluationContext):
+    shared_client = SharedClient(config)
+    first = LaunchDarklyProvider(shared_client)
+    second = LaunchDarklyProvider(shared_client)
+
+    assert first.client is second.client
+    assert first.resolve_boolean_details("fallthrough-boolean", False, evaluation_context).value is True
+
+    with patch.object(LDClient, 'close') as close:
+        first.shutdown()
+        first.shutdown()
+        close.assert_not_called()
+        assert second.resolve_boolean_details("fallthrough-boolean", False, evaluation_context).value is True
+
+        second.shutdown()
+        close.assert_called_once()
+
+    second.client.close()
+
+
+def test_provided_client_is_not_closed(config: Config):
+    client = LDClient(config)
+    provider = LaunchDarklyProvider(config, client=client)
+
+    assert provider.client is client
+
+    with patch.object(LDClient, 'close') as close:
+        provider.shutdown()
+        close.assert_not_called()
+
+    client.close()
+
+
+def test_initialize_warms_up_without_evaluating_flags(config: Config, evaluation_context: EvaluationContext):
+    provider = LaunchDarklyProvider(config, context_cache_size=10, include_flag_metadata=True,
+                                    warmup_flags=["fallthrough-boolean"], warmup_contexts=[evaluation_context])
+
+    with patch.object(LDClient, 'variation_detail') as variation_detail:
+        provider.initialize(EvaluationContext())
+    variation_detail.assert_not_called()
+
+    stats = provider.context_cache_stats
+    assert stats is not None
+    assert stats.size == 1
+
+    resolution_details = provider.resolve_boolean_details("fallthrough-boolean", False, EvaluationContext('user-key'))
+    assert resolution_details.value is True
+    stats = provider.context_cache_stats
+    assert stats is not None
+    assert stats.hits == 1
+
+    provider.shutdown()
+
+
+def test_warmup_failure_does_not_fail_initialization(config: Config, evaluation_context: EvaluationContext, caplog):
+    provider = LaunchDarklyProvider(config, warmup_contexts=[evaluation_context])
+
+    with patch.object(LDClient, 'all_flags_state', side_effect=RuntimeError("boom")):
+        provider.initialize(EvaluationContext())
+
+    assert "Warming up the provider failed: boom" in caplog.text
+    provider.shutdown()
+
+
 def test_not_providing_context_returns_error(provider: LaunchDarklyProvider):
     resolution_details = provider.resolve_boolean_details("flag-key", True, None)
 
@@ -142,6 +444,146 @@ def test_check_method_and_result_match_type(
     #assert isinstance(resolution_details.value, expected_type)
 
 
+def test_resolve_many_evaluates_each_flag(test_data_source: TestData, provider: LaunchDarklyProvider,
+                                          evaluation_context: EvaluationContext):
+    test_data_source.update(test_data_source.flag("string-flag").variations("a", "b").variation_for_all(1))
+
+    results = provider.resolve_many([
+        ("fallthrough-boolean", FlagType.BOOLEAN, False),
+        ("string-flag", FlagType.STRING, "default"),
+        ("fallthrough-boolean", FlagType.BOOLEAN, False),
+        ("missing-flag", FlagType.INTEGER, 7),
+    ], evaluation_context)
+
+    assert len(results) == 3
+    assert results["fallthrough-boolean"].value is True
+    assert results["fallthrough-boolean"].variant == '0'
+    assert results["string-flag"].value == "b"
+    assert results["string-flag"].variant == '1'
+    assert results["missing-flag"].value == 7
+    assert results["missing-flag"].error_code == ErrorCode.FLAG_NOT_FOUND
+
+
+def test_resolve_many_reports_type_mismatches(provider: LaunchDarklyProvider, evaluation_context: EvaluationContext):
+    results = provider.resolve_many([("fallthrough-boolean", FlagType.STRING, "default")], evaluation_context)
+
+    assert results["fallthrough-boolean"].value == "default"
+    assert results["fallthrough-boolean"].error_code == ErrorCode.TYPE_MISMATCH
+
+
+def test_resolve_many_converts_context_once(config: Config, evaluation_context: EvaluationContext):
+    provider = LaunchDarklyProvider(config, context_cache_size=10)
+    provider.resolve_many([("fallthrough-boolean", FlagType.BOOLEAN, False)] * 5, evaluation_context)
+
+    stats = provider.context_cache_stats
+    assert stats is not None
+    assert stats.misses == 1
+    assert stats.hits == 0
+
+
+def test_resolve_many_without_context_returns_errors(provider: LaunchDarklyProvider):
+    results = provider.resolve_many([("fallthrough-boolean", FlagType.BOOLEAN, False)], None)
+
+    assert results["fallthrough-boolean"].value is False
+    assert results["fallthrough-boolean"].error_code == ErrorCode.TARGETING_KEY_MISSING
+
+
+def test_resolve_all_flags_returns_details_for_every_flag(test_data_source: TestData,
+                                                          provider: LaunchDarklyProvider,
+                                                          evaluation_context: EvaluationContext):
+    test_data_source.update(test_data_source.flag("string-flag").variations("a", "b").variation_for_all(1))
+    test_data_source.update(test_data_source.flag("off-flag").variations("on", "off").off_variation(1).on(False))
+
+    results = provider.resolve_all_flags(evaluation_context)
+
+    assert set(results.keys()) == {"fallthrough-boolean", "string-flag", "off-flag"}
+
+    assert results["fallthrough-boolean"].value is True
+    assert results["fallthrough-boolean"].variant == '0'
+    assert results["fallthrough-boolean"].reason == 'FALLTHROUGH'
+
+    assert results["string-flag"].value == "b"
+    assert results["string-flag"].variant == '1'
+
+    assert results["off-flag"].value == "off"
+    assert results["off-flag"].reason == Reason.DISABLED
+
+
+def test_resolve_all_flags_without_context_is_empty(provider: LaunchDarklyProvider):
+    assert provider.resolve_all_flags(None) == {}
+
+
+def test_resolve_all_flags_with_invalid_context_is_empty(provider: LaunchDarklyProvider):
+    assert provider.resolve_all_flags(EvaluationContext()) == {}
+
+
+@pytest.mark.parametrize("max_workers", [0, 1, 4])
+def test_resolve_for_contexts_yields_results_in_order(test_data_source: TestData, provider: LaunchDarklyProvider,
+                                                      max_workers: int):
+    test_data_source.update(test_data_source.flag("targeted-flag").variations(False, True).fallthrough_variation(0)
+                            .variation_for_key('user', 'user-7', 1).variation_for_key('user', 'user-250', 1))
+
+    contexts = (EvaluationContext('user-%d' % index) for index in range(300))
+    results = list(provider.resolve_for_contexts("targeted-flag", FlagType.BOOLEAN, False, contexts,
+                                                 max_workers=max_workers, chunk_size=16))
+
+    assert len(results) == 300
+    assert [index for index, details in enumerate(results) if details.value] == [7, 250]
+    assert results[7].reason == Reason.TARGETING_MATCH
+    assert results[0].reason == 'FALLTHROUGH'
+
+
+def test_resolve_for_contexts_in_processes_yields_results_in_order(test_data_source: TestData,
+                                                                   provider: LaunchDarklyProvider):
+    test_data_source.update(test_data_source.flag("targeted-flag").variations("off", "on").fallthrough_variation(0)
+                            .variation_for_key('user', 'user-7', 1).variation_for_key('user', 'user-250', 1))
+
+    contexts = (EvaluationContext('user-%d' % index) for index in range(300))
+    results = list(provider.resolve_for_contexts_in_processes("targeted-flag", FlagType.STRING, "default",
+                                                              contexts, processes=2, chunk_size=32))
+
+    assert len(results) == 300
+    assert [index for index, details in enumerate(results) if details.value == "on"] == [7, 250]
+    assert results[7].reason == Reason.TARGETING_MATCH
+    assert results[7].variant == '1'
+    assert results[0].reason == 'FALLTHROUGH'
+
+
+def test_resolve_for_contexts_in_processes_uses_provider_validation(config: Config):
+    provider = LaunchDarklyProvider(config, context_validation='strict')
+    contexts = [EvaluationContext('user-key'), EvaluationContext('user-key', {'anonymous': 'yes'})]
+
+    in_threads = list(provider.resolve_for_contexts("fallthrough-boolean", FlagType.BOOLEAN, False, contexts))
+    in_processes = list(provider.resolve_for_contexts_in_processes("fallthrough-boolean", FlagType.BOOLEAN, False,
+                                                                   contexts, processes=1))
+
+    assert [details.value for details in in_processes] == [True, False]
+    assert [details.error_code for details in in_processes] == [details.error_code for details in in_threads]
+    assert in_processes[1].error_code is not None
+    provider.shutdown()
+
+
+def test_worker_processes_are_not_forked():
+    assert _worker_process_context().get_start_method() != 'fork'
+
+
+def test_resolve_for_contexts_reports_missing_contexts(provider: LaunchDarklyProvider):
+    results = list(provider.resolve_for_contexts("fallthrough-boolean", FlagType.BOOLEAN, False,
+                                                 [EvaluationContext('user-key'), None], max_workers=2))
+
+    assert results[0].value is True
+    assert results[1].error_code == ErrorCode.TARGETING_KEY_MISSING
+
+
+def test_resolve_for_contexts_can_be_abandoned(provider: LaunchDarklyProvider):
+    contexts = (EvaluationContext('user-%d' % index) for index in range(10000))
+    results = provider.resolve_for_contexts("fallthrough-boolean", FlagType.BOOLEAN, False, contexts,
+                                            max_workers=2, chunk_size=10)
+
+    assert next(results).value is True
+    results.close()
+
+
 def test_logger_changes_should_cascade_to_evaluation_converter(provider: LaunchDarklyProvider, caplog):
     _ = provider.resolve_boolean_details("fallthrough-boolean", False, EvaluationContext('user-key', {'kind': False}))
 
@@ -255,3 +697,216 @@ def test_provider_emits_configuration_event():
     assert thread_event.wait(timeout=5)
 
     api.shutdown()
+
+
+def test_initialize_async_does_not_block_event_loop():
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    async def run() -> Tuple[LaunchDarklyProvider, float]:
+        ticker = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+
+        # The data source only releases the client constructor once it has initialized, so creating the provider
+        # must not wait for the constructor.
+        started = time.monotonic()
+        provider = LaunchDarklyProvider(Config("", update_processor_class=LateReleasingDataSource,
+                                               send_events=False))
+        construction_time = time.monotonic() - started
+
+        await provider.initialize_async(EvaluationContext())
+        ticker.cancel()
+        return provider, construction_time
+
+    provider, construction_time = asyncio.run(run())
+
+    assert construction_time < 0.25
+    assert provider.client.is_initialized()
+    assert ticks > 10
+
+    provider.shutdown()
+
+
+class SlowFeatureStore(InMemoryFeatureStore):
+    """Records the flags read individually, taking a while to read each."""
+
+    def __init__(self, delay: float = 0):
+        super().__init__()
+        self.delay = delay
+        self.reads: List[str] = []
+
+    def get(self, kind, key, callback=lambda x: x):
+        self.reads.append(key)
+        time.sleep(self.delay)
+        return super().get(kind, key, callback)
+
+
+def test_initialize_async_warms_up_without_blocking_event_loop(test_data_source: TestData):
+    ticks = 0
+    store = SlowFeatureStore(delay=0.1)
+    provider = LaunchDarklyProvider(Config("", update_processor_class=test_data_source, feature_store=store,
+                                           send_events=False),
+                                    warmup_flags=["warmup-1", "warmup-2", "warmup-3"])
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    async def run():
+        ticker = asyncio.create_task(tick())
+        await asyncio.sleep(0)
+        await provider.initialize_async(EvaluationContext())
+        ticker.cancel()
+
+    asyncio.run(run())
+
+    assert store.reads == ["warmup-1", "warmup-2", "warmup-3"]
+    assert ticks > 10
+
+    provider.shutdown()
+
+
+def test_warm_up_runs_when_client_becomes_ready_after_start_wait():
+    store = SlowFeatureStore()
+    reads_when_ready: List[List[str]] = []
+    ready_event = threading.Event()
+
+    def on_emit(_provider, event: ProviderEvent, _details: ProviderEventDetails):
+        if event == ProviderEvent.PROVIDER_READY:
+            reads_when_ready.append(list(store.reads))
+            ready_event.set()
+
+    provider = LaunchDarklyProvider(Config("", update_processor_class=DelayedValidDataSource, feature_store=store,
+                                           send_events=False),
+                                    start_wait=0.01, warmup_flags=["warmup-flag"])
+    provider.attach(on_emit)
+
+    with pytest.raises(ProviderNotReadyError):
+        provider.initialize(EvaluationContext())
+    assert store.reads == []
+
+    assert ready_event.wait(timeout=5)
+    assert reads_when_ready[0] == ["warmup-flag"]
+
+    provider.shutdown()
+
+
+def test_initialize_async_raises_when_client_fails():
+    provider = LaunchDarklyProvider(Config("", update_processor_class=DelayedFailingDataSource, send_events=False))
+
+    with pytest.raises(ProviderFatalError):
+        asyncio.run(provider.initialize_async(EvaluationContext()))
+
+    provider.shutdown()
+
+
+def test_async_client_evaluations_resolve_through_provider(provider: LaunchDarklyProvider,
+                                                           evaluation_context: EvaluationContext):
+    async def run():
+        await provider.initialize_async(evaluation_context)
+        api.set_provider(provider)
+        return await api.get_client().get_boolean_details_async("fallthrough-boolean", False, evaluation_context)
+
+    details = asyncio.run(run())
+
+    assert details.value is True
+    assert details.variant == '0'
+
+    api.shutdown()
+
+
+def test_initialize_returns_not_ready_after_start_wait_and_becomes_ready_later():
+    ready_event = threading.Event()
+
+    def on_emit(_provider, event: ProviderEvent, _details: ProviderEventDetails):
+        if event == ProviderEvent.PROVIDER_READY:
+            ready_event.set()
+
+    provider = LaunchDarklyProvider(Config("", update_processor_class=DelayedValidDataSource, send_events=False),
+                                    start_wait=0.01)
+    provider.attach(on_emit)
+
+    with pytest.raises(ProviderNotReadyError):
+        provider.initialize(EvaluationContext())
+
+    assert ready_event.wait(timeout=5)
+    assert provider.client.is_initialized()
+
+    provider.shutdown()
+
+
+def test_initialize_async_returns_not_ready_after_start_wait():
+    provider = LaunchDarklyProvider(Config("", update_processor_class=DelayedValidDataSource, send_events=False),
+                                    start_wait=0.01)
+
+    with pytest.raises(ProviderNotReadyError):
+        asyncio.run(provider.initialize_async(EvaluationContext()))
+
+    provider.shutdown()
+
+
+def test_initialize_within_start_wait_succeeds(config: Config):
+    provider = LaunchDarklyProvider(config, start_wait=5)
+    provider.initialize(EvaluationContext())
+
+    assert provider.client.is_initialized()
+
+    provider.shutdown()
+
+
+def test_provider_writes_snapshot_on_shutdown(config: Config, tmp_path):
+    snapshot_path = str(tmp_path / "snapshot.json")
+    provider = LaunchDarklyProvider(config, snapshot_path=snapshot_path)
+    provider.initialize(EvaluationContext())
+    provider.shutdown()
+
+    with open(snapshot_path) as f:
+        assert "fallthrough-boolean" in json.load(f)['flags']
+
+
+def test_provider_starts_from_snapshot_then_switches_to_live_data(config: Config, tmp_path):
+    snapshot_path = str(tmp_path / "snapshot.json")
+    writer = LaunchDarklyProvider(config, snapshot_path=snapshot_path)
+    writer.shutdown()
+
+    provider = LaunchDarklyProvider(Config("", update_processor_class=DelayedValidDataSource, send_events=False),
+                                    snapshot_path=snapshot_path)
+    provider.initialize(EvaluationContext())
+
+    # Served from the snapshot before the data source is ready.
+    assert provider.resolve_boolean_details("fallthrough-boolean", False, EvaluationContext('user-key')).value is True
+
+    # The data source then replaces the snapshot with live data, which does not contain the flag.
+    deadline = time.time() + 5
+    while provider.resolve_boolean_details("fallthrough-boolean", False, EvaluationContext('user-key')).value:
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+    provider.shutdown()
+
+
+def test_flag_changes_can_be_coalesced():
+    changed = []
+    reported = threading.Event()
+
+    def on_emit(_provider, event: ProviderEvent, details: ProviderEventDetails):
+        if event == ProviderEvent.PROVIDER_CONFIGURATION_CHANGED:
+            changed.append(list(details.flags_changed or []))
+            reported.set()
+
+    provider = LaunchDarklyProvider(Config("", update_processor_class=MultiUpdatingDataSource, send_events=False),
+                                    flag_change_max_delay=0.5)
+    provider.attach(on_emit)
+    provider.initialize(EvaluationContext())
+
+    assert reported.wait(timeout=5)
+    assert changed == [["flag-a", "flag-b", "flag-c"]]
+
+    provider.shutdown()
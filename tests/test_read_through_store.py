@@ -0,0 +1,248 @@
+import threading
+import time
+from typing import Callable, List, Optional
+
+import pytest
+from ldclient import Config, Context
+from ldclient.feature_store import InMemoryFeatureStore
+from ldclient.impl.model.entity import ModelEntity
+from ldclient.integrations.test_data import TestData
+from ldclient.versioned_data_kind import FEATURES, SEGMENTS
+
+from ld_openfeature import LaunchDarklyProvider, ReadThroughFeatureStore
+
+
+class StandInStore(InMemoryFeatureStore):
+    """An in-memory stand-in for a persistent store, which counts reads and can fail or block them."""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+        self.error: Optional[Exception] = None
+        self.gate: Optional[threading.Event] = None
+
+    def get(self, kind, key, callback=lambda x: x):
+        self.__read()
+        return super().get(kind, key, callback)
+
+    def all(self, kind, callback=lambda x: x):
+        self.__read()
+        return super().all(kind, callback)
+
+    def is_available(self) -> bool:
+        return True
+
+    def __read(self):
+        self.reads += 1
+        if self.gate is not None:
+            self.gate.wait(1)
+        if self.error is not None:
+            raise self.error
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def flag(key: str, version: int, value: bool = True) -> dict:
+    return {'key': key, 'version': version, 'on': False, 'variations': [value], 'offVariation': 0}
+
+
+def wait_until(condition: Callable[[], bool]):
+    deadline = time.monotonic() + 1
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+@pytest.fixture
+def backing_store() -> StandInStore:
+    store = StandInStore()
+    store.init({FEATURES: {'flag': flag('flag', 1)}, SEGMENTS: {}})
+    return store
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def test_ttl_must_be_positive(backing_store: StandInStore):
+    with pytest.raises(ValueError):
+        ReadThroughFeatureStore(backing_store, ttl=0)
+
+
+def test_stale_ttl_must_not_be_negative(backing_store: StandInStore):
+    with pytest.raises(ValueError):
+        ReadThroughFeatureStore(backing_store, ttl=1, stale_ttl=-1)
+
+
+def test_items_are_read_through_and_cached(backing_store: StandInStore, clock: FakeClock):
+    store = ReadThroughFeatureStore(backing_store, ttl=10, clock=clock)
+
+    assert store.get(FEATURES, 'flag')['version'] == 1
+    assert store.get(FEATURES, 'flag')['version'] == 1
+    assert store.get(FEATURES, 'missing') is None
+    assert store.get(FEATURES, 'missing') is None
+
+    assert backing_store.reads == 2
+    stats = store.stats
+    assert stats.hits == 2
+    assert stats.misses == 2
+    assert stats.hit_rate == 0.5
+
+
+def test_all_items_are_cached(backing_store: StandInStore, clock: FakeClock):
+    store = ReadThroughFeatureStore(backing_store, ttl=10, clock=clock)
+
+    assert list(store.all(FEATURES, lambda items: items)) == ['flag']
+    assert list(store.all(FEATURES, lambda items: items)) == ['flag']
+    assert backing_store.reads == 1
+
+
+def test_expired_item_is_read_again(backing_store: StandInStore, clock: FakeClock):
+    store = ReadThroughFeatureStore(backing_store, ttl=10, clock=clock)
+    store.get(FEATURES, 'flag')
+
+    backing_store.upsert(FEATURES, flag('flag', 2))
+    clock.now += 10
+
+    assert store.get(FEATURES, 'flag')['version'] == 2
+    assert backing_store.reads == 2
+
+
+def test_stale_item_is_served_while_refreshed(backing_store: StandInStore, clock: FakeClock):
+    store = ReadThroughFeatureStore(backing_store, ttl=10, stale_ttl=60, clock=clock)
+    store.get(FEATURES, 'flag')
+
+    backing_store.upsert(FEATURES, flag('flag', 2))
+    clock.now += 30
+
+    assert store.get(FEATURES, 'flag')['version'] == 1
+    wait_until(lambda: store.get(FEATURES, 'flag')['version'] == 2)
+    assert store.stats.misses == 1
+
+
+def test_stale_item_is_refreshed_once(backing_store: StandInStore, clock: FakeClock):
+    store = ReadThroughFeatureStore(backing_store, ttl=10, stale_ttl=60, clock=clock)
+    store.get(FEATURES, 'flag')
+    clock.now += 30
+
+    backing_store.gate = threading.Event()
+    for _ in range(5):
+        store.get(FEATURES, 'flag')
+    wait_until(lambda: backing_store.reads == 2)
+    backing_store.gate.set()
+
+    time.sleep(0.01)
+    assert backing_store.reads == 2
+
+
+def test_stale_item_is_kept_when_refresh_fails(backing_store: StandInStore, clock: FakeClock):
+    store = ReadThroughFeatureStore(backing_store, ttl=10, stale_ttl=60, clock=clock)
+    store.get(FEATURES, 'flag')
+    clock.now += 30
+
+    backing_store.error = Exception("unavailable")
+    store.get(FEATURES, 'flag')
+    wait_until(lambda: backing_store.reads == 2)
+
+    assert store.get(FEATURES, 'flag')['version'] == 1
+
+
+def test_writes_are_passed_through_and_cached(backing_store: StandInStore, clock: FakeClock):
+    store = ReadThroughFeatureStore(backing_store, ttl=10, clock=clock)
+    store.all(FEATURES)
+
+    store.upsert(FEATURES, flag('other', 1))
+    store.delete(FEATURES, 'flag', 2)
+
+    assert store.get(FEATURES, 'other')['version'] == 1
+    assert store.get(FEATURES, 'flag') is None
+    assert backing_store.reads == 1
+    assert backing_store.get(FEATURES, 'other')['version'] == 1
+
+    # Every item of the kind is read again after a write.
+    assert list(store.all(FEATURES, lambda items: items)) == ['other']
+
+
+def test_written_items_are_cached_as_model_objects(backing_store: StandInStore, clock: FakeClock):
+    store = ReadThroughFeatureStore(backing_store, ttl=10, clock=clock)
+    store.upsert(FEATURES, flag('flag', 2))
+
+    item = store.get(FEATURES, 'flag')
+    assert isinstance(item, ModelEntity)
+    assert backing_store.reads == 0
+    assert item == backing_store.get(FEATURES, 'flag')
+
+
+def test_older_version_does_not_replace_cached_item(backing_store: StandInStore, clock: FakeClock):
+    store = ReadThroughFeatureStore(backing_store, ttl=10, clock=clock)
+    store.upsert(FEATURES, flag('flag', 3))
+    store.upsert(FEATURES, flag('flag', 2))
+
+    assert store.get(FEATURES, 'flag')['version'] == 3
+
+
+def test_read_completing_after_write_does_not_replace_newer_item(backing_store: StandInStore, clock: FakeClock):
+    store = ReadThroughFeatureStore(backing_store, ttl=10, clock=clock)
+    backing_store.gate = threading.Event()
+
+    results: List[dict] = []
+    reader = threading.Thread(target=lambda: results.append(store.get(FEATURES, 'flag')))
+    reader.start()
+    wait_until(lambda: backing_store.reads == 1)
+
+    # A write lands while the read is in progress, after which the wrapped store still returns version 1.
+    store.upsert(FEATURES, flag('flag', 2))
+    backing_store.init({FEATURES: {'flag': flag('flag', 1)}, SEGMENTS: {}})
+    backing_store.gate.set()
+    reader.join()
+
+    assert results[0]['version'] == 1
+    assert store.get(FEATURES, 'flag')['version'] == 2
+
+
+def test_init_clears_cache(backing_store: StandInStore, clock: FakeClock):
+    store = ReadThroughFeatureStore(backing_store, ttl=10, clock=clock)
+    store.get(FEATURES, 'flag')
+
+    store.init({FEATURES: {'flag': flag('flag', 5)}, SEGMENTS: {}})
+
+    assert store.get(FEATURES, 'flag')['version'] == 5
+    assert store.initialized
+
+
+def test_wrapped_store_capabilities_are_exposed(backing_store: StandInStore):
+    store = ReadThroughFeatureStore(backing_store, ttl=10)
+
+    assert store.store is backing_store
+    assert store.is_available()
+    assert not hasattr(store, 'missing_capability')
+
+
+def test_provider_evaluates_from_cache(backing_store: StandInStore):
+    store = ReadThroughFeatureStore(backing_store, ttl=10)
+    config = Config("sdk-key", feature_store=store, use_ldd=True, send_events=False)
+    provider = LaunchDarklyProvider(config)
+
+    client = provider.client
+    assert client.variation('flag', Context.create('user-key'), False) is True
+    assert client.variation('flag', Context.create('user-key'), False) is True
+
+    stats = provider.store_cache_stats
+    assert stats is not None
+    assert stats.hits >= 1
+    provider.shutdown()
+
+
+def test_provider_without_read_through_store_has_no_stats():
+    td = TestData.data_source()
+    provider = LaunchDarklyProvider(Config("sdk-key", update_processor_class=td, send_events=False))
+
+    assert provider.store_cache_stats is None
+    provider.shutdown()
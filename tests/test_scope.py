@@ -0,0 +1,65 @@
+import pytest
+from ldclient import Context
+from ldclient.integrations.test_data import TestData
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.exception import ErrorCode
+
+from ld_openfeature import LaunchDarklyProvider, Config
+
+
+@pytest.fixture
+def test_data_source() -> TestData:
+    td = TestData.data_source()
+    td.update(td.flag("fallthrough-boolean").variation_for_all(True))
+    td.update(td.flag("string-flag").variations("a", "b").variation_for_all(1))
+    td.update(td.flag("number-flag").variations(1, 2.5).variation_for_all(1))
+    td.update(td.flag("object-flag").variations({'a': 1}).variation_for_all(0))
+    td.update(td.flag("org-flag").variations(False, True).fallthrough_variation(0)
+              .if_match_context('org', 'key', 'org-key').then_return(1))
+    return td
+
+
+@pytest.fixture
+def provider(test_data_source: TestData) -> LaunchDarklyProvider:
+    return LaunchDarklyProvider(Config("example-key", update_processor_class=test_data_source, send_events=False),
+                                context_cache_size=10)
+
+
+def test_scope_resolves_each_flag_type(provider: LaunchDarklyProvider):
+    with provider.scope(EvaluationContext('user-key')) as scope:
+        assert scope.resolve_boolean_details("fallthrough-boolean", False).value is True
+        assert scope.resolve_string_details("string-flag", "default").value == "b"
+        assert scope.resolve_integer_details("number-flag", 0).value == 2
+        assert scope.resolve_float_details("number-flag", 0.0).value == 2.5
+        assert scope.resolve_object_details("object-flag", {}).value == {'a': 1}
+
+
+def test_scope_converts_context_once(provider: LaunchDarklyProvider):
+    with provider.scope(EvaluationContext('user-key')) as scope:
+        for _ in range(5):
+            scope.resolve_boolean_details("fallthrough-boolean", False)
+
+    stats = provider.context_cache_stats
+    assert stats is not None
+    assert stats.misses == 1
+    assert stats.hits == 0
+
+
+def test_scope_reports_type_mismatches(provider: LaunchDarklyProvider):
+    with provider.scope(EvaluationContext('user-key')) as scope:
+        details = scope.resolve_string_details("fallthrough-boolean", "default")
+
+    assert details.value == "default"
+    assert details.error_code == ErrorCode.TYPE_MISMATCH
+
+
+def test_scope_accepts_a_prebuilt_ld_context(provider: LaunchDarklyProvider):
+    ld_context = Context.create('org-key', 'org')
+
+    with provider.scope(ld_context) as scope:
+        assert scope.ld_context is ld_context
+        assert scope.resolve_boolean_details("org-flag", False).value is True
+
+    stats = provider.context_cache_stats
+    assert stats is not None
+    assert stats.misses == 0
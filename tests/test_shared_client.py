@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+import pytest
+from ldclient import Config, LDClient
+from ldclient.integrations.test_data import TestData
+
+from ld_openfeature import SharedClient
+
+
+@pytest.fixture
+def shared_client() -> SharedClient:
+    return SharedClient(Config("example-key", update_processor_class=TestData.data_source(), send_events=False))
+
+
+def test_client_is_created_once(shared_client: SharedClient):
+    first = shared_client.acquire()
+    second = shared_client.acquire()
+
+    assert first is second
+    assert shared_client.references == 2
+
+    shared_client.release()
+    shared_client.release()
+
+
+def test_client_is_closed_by_last_release(shared_client: SharedClient):
+    client = shared_client.acquire()
+    shared_client.acquire()
+
+    with patch.object(LDClient, 'close') as close:
+        shared_client.release()
+        close.assert_not_called()
+
+        shared_client.release()
+        close.assert_called_once()
+
+    client.close()
+
+
+def test_client_is_recreated_after_last_release(shared_client: SharedClient):
+    first = shared_client.acquire()
+    shared_client.release()
+
+    second = shared_client.acquire()
+    shared_client.release()
+
+    assert second is not first
+
+
+def test_release_without_acquire_is_an_error(shared_client: SharedClient):
+    with pytest.raises(RuntimeError):
+        shared_client.release()